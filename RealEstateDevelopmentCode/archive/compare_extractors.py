@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Test script to compare the new generic PDF extraction with the old Gresham-specific extraction.
+"""
+
+import os
+import sys
+import hashlib
+import logging
+import tempfile
+import shutil
+from itertools import zip_longest
+from pathlib import Path
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('extraction_comparison')
+
+# Add project root to path for imports
+SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+DATA_ROOT = Path("/workspace/data")
+sys.path.insert(0, str(DATA_ROOT))
+
+def run_gresham_extractor():
+    """Run the original Gresham-specific extractor."""
+    logger.info("Running Gresham-specific extractor...")
+    
+    try:
+        # The extractor scripts exit on import failure, so treat SystemExit as an error
+        from extract_all_gresham_pdfs import extract_pdfs as gresham_extract
+        gresham_extract(force=True)
+        
+        logger.info("Gresham extractor finished successfully")
+        return True
+    except (Exception, SystemExit) as e:
+        logger.error(f"Exception running Gresham extractor: {str(e)}")
+        return False
+
+def run_generic_extractor():
+    """Run the new generic PDF extractor for Gresham."""
+    logger.info("Running generic extractor for Gresham...")
+    
+    try:
+        from extract_pdfs import extract_pdfs as generic_extract
+        result = generic_extract("Oregon", "gresham", force=True)
+        
+        if not result["success"]:
+            logger.error(f"Error running generic extractor: {result['message']}")
+            return False
+        
+        logger.info("Generic extractor finished successfully")
+        return True
+    except (Exception, SystemExit) as e:
+        logger.error(f"Exception running generic extractor: {str(e)}")
+        return False
+
+def file_digest(path):
+    """Get the SHA-256 digest of a file's raw bytes."""
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            # Python 3.11+: the read loop runs in C without holding the GIL
+            return hashlib.file_digest(f, 'sha256').digest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+        return digest.digest()
+
+def load_json(path):
+    """Parse a JSON file."""
+    with open(path, 'rb') as f:
+        return json_loads(f.read())
+
+def first_diff(path_a, path_b):
+    """
+    Find the first difference between two JSON files.
+    
+    With ijson available, both files are streamed as (prefix, event, value)
+    events and compared in lockstep, so memory use is bounded by nesting
+    depth rather than file size. Unlike a full load, the comparison is
+    sensitive to object key order. Returns the first pair of differing
+    events (None for a stream that ended early), or None if the files are
+    equivalent. Without ijson both files are loaded and compared whole, and
+    a difference is reported as (None, None).
+    """
+    if ijson is None:
+        return None if load_json(path_a) == load_json(path_b) else (None, None)
+    
+    with open(path_a, 'rb') as a, open(path_b, 'rb') as b:
+        for event_a, event_b in zip_longest(ijson.parse(a), ijson.parse(b)):
+            if event_a != event_b:
+                return event_a, event_b
+    return None
+
+def compare_results():
+    """Compare the extraction results from both extractors."""
+    logger.info("Comparing extraction results...")
+    
+    # Create temp directory to store Gresham-specific results. It lives under
+    # DATA_ROOT so the restore step can rename files back instead of copying.
+    with tempfile.TemporaryDirectory(dir=DATA_ROOT) as temp_dir:
+        temp_path = Path(temp_dir)
+        
+        # Path to content files
+        content_dir = DATA_ROOT / "pdf_content" / "Oregon" / "gresham"
+        
+        # First backup existing results
+        logger.info(f"Backing up existing content to {temp_path}")
+        if content_dir.exists():
+            for json_file in content_dir.glob("*.json"):
+                # copyfile uses in-kernel sendfile on Linux and skips metadata copying
+                shutil.copyfile(json_file, temp_path / json_file.name)
+        
+        # Run Gresham extractor
+        success_gresham = run_gresham_extractor()
+        
+        if not success_gresham:
+            logger.error("Gresham extractor failed, skipping comparison")
+            return
+        
+        # Record digests of the Gresham results, keeping a copy on disk so
+        # that files whose bytes differ can be parsed and compared later
+        gresham_dir = temp_path / "gresham"
+        gresham_dir.mkdir()
+        gresham_results = {}
+        for json_file in content_dir.glob("*.json"):
+            try:
+                gresham_results[json_file.name] = file_digest(json_file)
+                shutil.copyfile(json_file, gresham_dir / json_file.name)
+            except Exception as e:
+                logger.error(f"Error reading {json_file}: {str(e)}")
+        
+        logger.info(f"Processed {len(gresham_results)} files with Gresham extractor")
+        
+        # Run generic extractor
+        success_generic = run_generic_extractor()
+        
+        if not success_generic:
+            logger.error("Generic extractor failed, skipping comparison")
+            return
+        
+        # Compare results
+        different_files = 0
+        missing_files = 0
+        extra_files = 0
+        
+        # Check generic results against Gresham results
+        generic_results = {}
+        for json_file in content_dir.glob("*.json"):
+            try:
+                digest = file_digest(json_file)
+                generic_results[json_file.name] = digest
+                
+                # Compare with Gresham results; identical bytes need no parsing
+                if json_file.name in gresham_results:
+                    if digest != gresham_results[json_file.name]:
+                        diff = first_diff(gresham_dir / json_file.name, json_file)
+                        if diff is not None:
+                            different_files += 1
+                            logger.info(f"File content differs: {json_file.name}")
+                            logger.debug(f"First difference in {json_file.name}: {diff[0]} != {diff[1]}")
+                else:
+                    extra_files += 1
+                    logger.info(f"Extra file in generic results: {json_file.name}")
+                    
+            except Exception as e:
+                logger.error(f"Error reading {json_file}: {str(e)}")
+        
+        # Check for missing files in generic results
+        for filename in gresham_results:
+            if filename not in generic_results:
+                missing_files += 1
+                logger.info(f"Missing file in generic results: {filename}")
+        
+        # Print summary
+        logger.info("=== Comparison Summary ===")
+        logger.info(f"Gresham extractor: {len(gresham_results)} files")
+        logger.info(f"Generic extractor: {len(generic_results)} files")
+        logger.info(f"Different content: {different_files} files")
+        logger.info(f"Missing in generic: {missing_files} files")
+        logger.info(f"Extra in generic: {extra_files} files")
+        
+        # Restore original files
+        logger.info("Restoring original files...")
+        for json_file in temp_path.glob("*.json"):
+            dest_file = content_dir / json_file.name
+            # A rename on the same filesystem; falls back to a copy otherwise
+            shutil.move(json_file, dest_file)
+
+if __name__ == "__main__":
+    compare_results()
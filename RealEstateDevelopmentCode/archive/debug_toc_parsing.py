@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Debug TOC parsing to understand the structure
+"""
+
+import re
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.common.utils import load_json_mapped
+
+# Pattern for SECTION headers
+SECTION_HEADER_RE = re.compile(r'SECTION\s+(\d+\.\d+)\s+([A-Z\s]+)', re.MULTILINE)
+
+# Patterns to test against the TOC text, compiled once at import
+TOC_PATTERNS = [
+    (SECTION_HEADER_RE, "SECTION headers"),
+    # Pattern for subsection entries with dots
+    (re.compile(r'(\d+\.\d{4})\s+([^.]+?)\s+\.+\s*\[([^\]]+)\]', re.MULTILINE),
+     "Subsection entries with page refs"),
+    # Pattern for subsection entries without dots
+    (re.compile(r'(\d+\.\d{4})\s+([^.\n]+?)(?=\s*\n|\s+\d+\.\d{4})', re.MULTILINE),
+     "Subsection entries without page refs"),
+    # Pattern for document level (XX.XX format)
+    (re.compile(r'(\d+\.\d{2})\s+([^.\n]+?)(?=\s*\n|\s+\d+\.\d)', re.MULTILINE),
+     "Document level entries"),
+    # General number pattern
+    (re.compile(r'(\d+\.\d+)', re.MULTILINE), "All numbers"),
+]
+
+def debug_toc_parsing():
+    toc_file = "/workspace/data/pdf_content/Oregon/gresham/dc-table-of-contents.json"
+    
+    toc_data = load_json_mapped(toc_file)
+    
+    # Collect all text from pages, joined once at the end
+    page_texts = []
+    page_count = 0
+    
+    print("Analyzing TOC structure...")
+    
+    for key, value in toc_data.items():
+        if isinstance(value, dict) and 'text' in value:
+            page_texts.append(value['text'])
+            page_count += 1
+            print(f"Found page with text: {key}")
+        elif isinstance(value, list):
+            for i, page in enumerate(value):
+                if isinstance(page, dict) and 'text' in page:
+                    page_texts.append(page['text'])
+                    page_count += 1
+                    print(f"Found page in list {key}[{i}] with text")
+    
+    all_text = "\n".join(page_texts)
+    print(f"Total pages with text: {page_count}")
+    print(f"Total text length: {len(all_text)}")
+    
+    # Show sample text
+    print("\nSample text (first 1000 chars):")
+    print(all_text[:1000])
+    
+    # Test different patterns
+    for pattern, description in TOC_PATTERNS:
+        matches = pattern.findall(all_text)
+        print(f"\n{description}: Found {len(matches)} matches")
+        if matches:
+            print("Sample matches:")
+            for i, match in enumerate(matches[:5]):
+                print(f"  {i+1}: {match}")
+    
+    # Look for SECTION patterns specifically
+    print("\nSearching for SECTION patterns...")
+    section_matches = SECTION_HEADER_RE.finditer(all_text)
+    for i, match in enumerate(section_matches):
+        if i >= 10:  # Limit output
+            break
+        print(f"  SECTION {match.group(1)}: {match.group(2).strip()}")
+
+if __name__ == "__main__":
+    debug_toc_parsing()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Simple script to demonstrate the corrected hierarchical document structure.
+"""
+
+import os
+import re
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.common.utils import load_json_mapped
+
+# Type prefix of a document filename, e.g. "dc-section-"
+DOC_TYPE_RE = re.compile(r'dc-(section|article|appendix)-')
+
+# IDs embedded in document filenames, e.g. "dc-section-10.0400", "dc-article-3"
+SECTION_ID_RE = re.compile(r'dc-section-(\d+\.\d{4})')
+SECTION_DOC_ID_RE = re.compile(r'dc-section-(\d+\.\d{2})')
+ARTICLE_ID_RE = re.compile(r'dc-article-(\d+)')
+APPENDIX_ID_RE = re.compile(r'dc-appendix-(\d+)')
+
+# TOC section entries, e.g. "10.0400 Title for section". Groups are the full
+# section ID, its document-level ID (10.04) and the title.
+TOC_SECTION_RE = re.compile(r'((\d+\.\d{2})\d{2})\s+(.*?)(?=\d+\.\d{4}|\Z)', re.DOTALL)
+
+def analyze_hierarchical_structure():
+    """
+    Analyze document structure with the correct hierarchical understanding.
+    """
+    # Path to TOC and document files
+    toc_path = Path("/workspace/data/pdf_content/Oregon/gresham/dc-table-of-contents.json")
+    docs_dir = Path("/workspace/data/pdf_content/Oregon/gresham")
+    
+    # Load TOC
+    if not toc_path.exists():
+        print(f"ERROR: TOC file not found at {toc_path}")
+        return
+    
+    toc_data = load_json_mapped(toc_path)
+    
+    toc_content = toc_data.get('content', '')
+    print(f"Loaded TOC with {len(toc_content)} characters")
+    
+    # Scan, categorize and extract document IDs from the available files in one pass
+    doc_files = []
+    section_files = []
+    article_files = []
+    appendix_files = []
+    other_files = []
+    section_ids = []
+    available_docs = set()
+    
+    with os.scandir(docs_dir) as entries:
+        for entry in entries:
+            fname = entry.name
+            if not fname.endswith(".json") or fname == "dc-table-of-contents.json":
+                continue
+            doc_files.append(fname)
+            
+            type_match = DOC_TYPE_RE.match(fname)
+            doc_type = type_match.group(1) if type_match else None
+            
+            if doc_type == "section":
+                section_files.append(fname)
+                match = SECTION_ID_RE.match(fname)
+                if match:
+                    section_ids.append(match.group(1))
+                match = SECTION_DOC_ID_RE.match(fname)
+                if match:
+                    available_docs.add(match.group(1))
+            elif doc_type == "article":
+                article_files.append(fname)
+                match = ARTICLE_ID_RE.match(fname)
+                if match:
+                    available_docs.add(f"Article {match.group(1)}")
+            elif doc_type == "appendix" or "appendix" in fname.lower():
+                appendix_files.append(fname)
+                match = APPENDIX_ID_RE.match(fname)
+                if match:
+                    available_docs.add(f"Appendix {match.group(1)}")
+            else:
+                other_files.append(fname)
+    
+    print(f"Found {len(doc_files)} document files")
+    
+    print(f"\nFile categories:")
+    print(f"  Sections: {len(section_files)}")
+    print(f"  Articles: {len(article_files)}")
+    print(f"  Appendices: {len(appendix_files)}")
+    print(f"  Other: {len(other_files)}")
+    
+    # Now extract TOC entries with hierarchical understanding
+    # Group TOC entries by document-level ID (XX.YY format) in a single pass
+    doc_hierarchy = {}
+    toc_entry_count = 0
+    for match in TOC_SECTION_RE.finditer(toc_content):
+        # Document-level ID (like 10.04 from 10.0400) is captured by the regex
+        section_id, doc_id = match.group(1, 2)
+        doc_hierarchy.setdefault(doc_id, []).append(section_id)
+        toc_entry_count += 1
+    
+    # Count unique document-level entries
+    unique_doc_ids = doc_hierarchy.keys()
+    print(f"\nTOC Document Structure Analysis:")
+    print(f"  Total TOC entries: {toc_entry_count}")
+    print(f"  Unique document-level entries: {len(unique_doc_ids)}")
+    
+    # Report on document structure
+    print(f"\nDocument Hierarchy Examples:")
+    count = 0
+    for doc_id, subsections in sorted(doc_hierarchy.items())[:5]:  # Show first 5 examples
+        print(f"  Document {doc_id}:")
+        for i, subsection in enumerate(subsections[:3]):  # Show first 3 subsections
+            print(f"    - Subsection: {subsection}")
+        if len(subsections) > 3:
+            print(f"    - ... and {len(subsections) - 3} more subsections")
+        count += 1
+    
+    if len(doc_hierarchy) > 5:
+        print(f"  ... and {len(doc_hierarchy) - 5} more documents")
+    
+    # Compare document-level entries with available files
+    matched_docs = available_docs.intersection(unique_doc_ids)
+    missing_docs = unique_doc_ids - available_docs
+    orphaned_files = available_docs - unique_doc_ids
+    
+    print(f"\nCORRECTED Alignment Analysis:")
+    print(f"  Document-level entries in TOC: {len(unique_doc_ids)}")
+    print(f"  Available document files: {len(available_docs)}")
+    print(f"  Successfully matched documents: {len(matched_docs)}")
+    print(f"  Missing documents: {len(missing_docs)}")
+    print(f"  Orphaned files: {len(orphaned_files)}")
+    
+    if unique_doc_ids:
+        alignment_score = (len(matched_docs) / len(unique_doc_ids)) * 100
+        print(f"  Alignment score: {alignment_score:.1f}%")
+    
+    print("\nCONCLUSION:")
+    print("  The corrected analysis properly recognizes the hierarchical nature of municipal codes,")
+    print("  where document files correspond to XX.YY entries, not every TOC entry.")
+
+if __name__ == "__main__":
+    analyze_hierarchical_structure()
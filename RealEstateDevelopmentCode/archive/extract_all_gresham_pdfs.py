@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Script to extract content from all Gresham PDFs and verify against the TOC.
+"""
+
+import os
+import json
+import sys
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+import logging
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger("gresham_extractor")
+
+# Print current working directory for debugging
+print(f"Current working directory: {os.getcwd()}")
+
+# Constants
+PDF_DIR = Path("/workspace/data/raw_pdfs/Oregon/gresham")
+OUTPUT_DIR = Path("/workspace/data/pdf_content/Oregon/gresham")
+PROJECT_ROOT = Path("/workspace/data/RealEstateDevelopmentCode")
+RE_EXTRACTOR_PATH = PROJECT_ROOT / "scripts" / "re-extractor"
+
+# Extractor owned by the current worker process, set by _init_worker
+_EXTRACTOR = None
+
+# Records the (mtime_ns, size) of each PDF at its last successful extraction.
+# No .json suffix so that scans of the output directory for results skip it.
+MANIFEST_FILENAME = ".gresham_extraction_manifest"
+
+# Add project root and RE-extractor path to Python path
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(RE_EXTRACTOR_PATH))
+
+from scripts.common.utils import write_bytes_atomic
+
+try:
+    from pdf_extractor import EnhancedPDFExtractor
+    logger.info("Successfully imported EnhancedPDFExtractor")
+except ImportError as e:
+    logger.error(f"Error importing EnhancedPDFExtractor: {e}")
+    sys.exit(1)
+
+def _write_json(output_path, data):
+    """Write extraction results to disk as indented JSON, replacing the file atomically."""
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, indent=2).encode('utf-8')
+    write_bytes_atomic(output_path, payload)
+
+def _load_manifest():
+    """Load the extraction manifest, or an empty one if missing or unreadable."""
+    try:
+        with open(OUTPUT_DIR / MANIFEST_FILENAME, 'rb') as f:
+            return json.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+def _save_manifest(manifest):
+    """Save the extraction manifest."""
+    with open(OUTPUT_DIR / MANIFEST_FILENAME, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
+
+def _get_max_workers(num_files, requested=None):
+    """Get the number of worker processes to use for a batch of PDFs."""
+    workers = requested or os.cpu_count() or 1
+    return max(1, min(num_files, workers))
+
+def _init_worker():
+    """Build the extractor once per worker process and reuse it for every PDF."""
+    global _EXTRACTOR
+    _EXTRACTOR = EnhancedPDFExtractor()
+
+def _extract_one(pdf_file, output_dir):
+    """Extract a single PDF in a worker process. Returns True on success."""
+    name = pdf_file.name
+    try:
+        # Define output path
+        output_path = output_dir / f"{pdf_file.stem}.json"
+        
+        # Extract content
+        logger.info(f"Processing {name}")
+        result = _EXTRACTOR.extract_document(pdf_file)
+        
+        # Save result to JSON
+        _write_json(output_path, result)
+        
+        logger.info(f"Saved extraction to {output_path}")
+        return True
+            
+    except Exception as e:
+        logger.error(f"Error processing {name}: {e}")
+        return False
+
+def extract_pdfs(max_workers=None, force=False):
+    """
+    Extract all PDFs in the Gresham directory.
+    
+    PDFs whose size and mtime match the manifest entry from their last
+    extraction, and whose output JSON is newer, are skipped unless force is set.
+    """
+    pdf_files = list(PDF_DIR.glob("*.pdf*"))
+    logger.info(f"Found {len(pdf_files)} PDF files to process")
+    
+    # Create output directory if it doesn't exist
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    
+    # Skip PDFs that have not changed since their last extraction
+    manifest = {} if force else _load_manifest()
+    pending = []
+    signatures = []
+    for pdf_file in pdf_files:
+        stat = pdf_file.stat()
+        signature = [stat.st_mtime_ns, stat.st_size]
+        if manifest.get(pdf_file.name) == signature:
+            # One stat call both checks that the output exists and reads its mtime
+            try:
+                if os.stat(OUTPUT_DIR / f"{pdf_file.stem}.json").st_mtime_ns >= stat.st_mtime_ns:
+                    continue
+            except FileNotFoundError:
+                pass
+        pending.append(pdf_file)
+        signatures.append(signature)
+    
+    skipped_count = len(pdf_files) - len(pending)
+    if skipped_count:
+        logger.info(f"Skipping {skipped_count} unchanged PDF files")
+    
+    # Process PDFs in parallel, one extraction per worker task
+    success_count = 0
+    if pending:
+        workers = _get_max_workers(len(pending), max_workers)
+        logger.info(f"Extracting with {workers} worker processes")
+        extract_one = partial(_extract_one, output_dir=OUTPUT_DIR)
+        # _init_worker gives each worker process its own EnhancedPDFExtractor
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            outcomes = executor.map(extract_one, pending, chunksize=1)
+            for pdf_file, signature, succeeded in zip(pending, signatures, outcomes):
+                if succeeded:
+                    success_count += 1
+                    manifest[pdf_file.name] = signature
+        _save_manifest(manifest)
+    
+    logger.info(f"Extraction complete. Successfully processed {success_count} of {len(pending)} files "
+                f"({skipped_count} unchanged files skipped).")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Extract content from all Gresham PDFs.")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Number of worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-extract PDFs even if they are unchanged since the last run")
+    args = parser.parse_args()
+    extract_pdfs(max_workers=args.workers, force=args.force)
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Generic script to extract content from PDF files for any jurisdiction.
+"""
+
+import os
+import sys
+import json
+import asyncio
+import argparse
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Add project root to path for imports
+SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_ROOT = Path("/workspace/data/RealEstateDevelopmentCode")
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# Import common configuration
+try:
+    from scripts.common.config import (
+        get_jurisdiction_dirs,
+        ensure_jurisdiction_dirs,
+        PDF_CONTENT_DIR,
+        RAW_PDFS_DIR,
+        RE_EXTRACTOR_DIR
+    )
+    from scripts.common.utils import write_bytes_atomic
+except ImportError:
+    print("Failed to import common configuration. Make sure the common module is properly set up.")
+    sys.exit(1)
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger("pdf_extractor")
+
+# Extractor owned by the current worker process, set by _init_worker
+_EXTRACTOR = None
+
+# Records the (mtime_ns, size) of each PDF at its last successful extraction.
+# No .json suffix so that scans of the output directory for results skip it.
+MANIFEST_FILENAME = ".extraction_manifest"
+
+def setup_extractor(state: str, city: str) -> Any:
+    """Set up the PDF extractor for a specific jurisdiction."""
+    try:
+        # Add RE-extractor path to Python path
+        sys.path.insert(0, str(RE_EXTRACTOR_DIR))
+        
+        # Import the enhanced PDF extractor
+        from pdf_extractor import EnhancedPDFExtractor
+        logger.info("Successfully imported EnhancedPDFExtractor")
+        
+        return EnhancedPDFExtractor()
+    except ImportError as e:
+        logger.error(f"Error importing EnhancedPDFExtractor: {e}")
+        try:
+            # Fall back to the compatibility wrapper
+            sys.path.insert(0, str(PROJECT_ROOT / "scripts" / "re-crawler"))
+            from utils.pdf_extractor_wrapper import PDFExtractor
+            logger.info("Falling back to PDFExtractor compatibility wrapper")
+            return PDFExtractor()
+        except ImportError as e2:
+            logger.error(f"Error importing PDFExtractor wrapper: {e2}")
+            return None
+
+def _serialize_json(data: Any) -> bytes:
+    """Serialize extraction results as indented JSON."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+def _load_manifest(output_dir: Path) -> Dict[str, List[int]]:
+    """Load the extraction manifest, or an empty one if missing or unreadable."""
+    try:
+        with open(output_dir / MANIFEST_FILENAME, "rb") as f:
+            return json.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+def _save_manifest(output_dir: Path, manifest: Dict[str, List[int]]) -> None:
+    """Save the extraction manifest."""
+    with open(output_dir / MANIFEST_FILENAME, "w") as f:
+        json.dump(manifest, f)
+
+def _output_path(pdf_file: Path, output_dir: Path) -> Path:
+    """Get the JSON output path for a PDF."""
+    return output_dir / (pdf_file.stem.lower().replace(" ", "-") + ".json")
+
+def _is_unchanged(name: str, pdf_stat: os.stat_result, output_path: Path,
+                  manifest: Dict[str, List[int]]) -> bool:
+    """Check whether a PDF matches its manifest entry and has an up-to-date output."""
+    if manifest.get(name) != [pdf_stat.st_mtime_ns, pdf_stat.st_size]:
+        return False
+    try:
+        # One stat call both checks that the output exists and reads its mtime
+        return os.stat(output_path).st_mtime_ns >= pdf_stat.st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+def _get_max_workers(num_files: int, requested: Optional[int] = None) -> int:
+    """Get the number of worker processes to use for a batch of PDFs."""
+    workers = requested or os.cpu_count() or 1
+    return max(1, min(num_files, workers))
+
+def _init_worker(state: str, city: str) -> None:
+    """Build the extractor once per worker process and reuse it for every PDF."""
+    global _EXTRACTOR
+    _EXTRACTOR = setup_extractor(state, city)
+
+def _extract_one_bytes(pdf_file: Path) -> bytes:
+    """Extract a single PDF in a worker process and return the serialized JSON."""
+    logger.info(f"Processing: {pdf_file.name}")
+    
+    if not _EXTRACTOR:
+        raise RuntimeError("Failed to initialize PDF extractor")
+    
+    return _serialize_json(_EXTRACTOR.extract_document(pdf_file))
+
+async def _run_pipeline(pdf_files: List[Path], output_dir: Path, state: str, city: str,
+                        workers: int) -> List[Dict[str, Any]]:
+    """
+    Extract PDFs in worker processes and write the results from the event loop.
+    
+    Workers only parse and serialize, so they move on to the next PDF while
+    the previous result is written to disk on a thread. The semaphore caps
+    the number of serialized results held in memory at once.
+    """
+    loop = asyncio.get_running_loop()
+    sem = asyncio.Semaphore(workers * 2)
+    
+    async def one(pdf_file: Path) -> Dict[str, Any]:
+        name = pdf_file.name
+        async with sem:
+            try:
+                payload = await loop.run_in_executor(pool, _extract_one_bytes, pdf_file)
+                output_path = _output_path(pdf_file, output_dir)
+                await loop.run_in_executor(None, write_bytes_atomic, output_path, payload)
+                logger.info(f"Successfully extracted: {name} -> {output_path}")
+                return {"file": str(pdf_file), "success": True}
+            except Exception as e:
+                logger.error(f"Error processing {name}: {str(e)}")
+                return {"file": str(pdf_file), "success": False, "error": str(e)}
+    
+    # Extractors are not picklable, so each worker builds its own at startup
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(state, city)) as pool:
+        return await asyncio.gather(*(one(pdf_file) for pdf_file in pdf_files))
+
+def extract_pdfs(state: str, city: str, max_workers: Optional[int] = None,
+                 force: bool = False) -> Dict[str, Any]:
+    """
+    Extract all PDFs for a specific jurisdiction.
+    
+    PDFs whose size and mtime match the manifest entry from their last
+    extraction, and whose output JSON is newer, are skipped unless force is set.
+    """
+    try:
+        # Ensure directories exist
+        dirs = ensure_jurisdiction_dirs(state, city)
+        pdf_dir = dirs["raw_pdfs"]
+        output_dir = dirs["pdf_content"]
+        
+        # Find all PDF files
+        pdf_files = list(pdf_dir.glob("*.pdf*"))
+        logger.info(f"Found {len(pdf_files)} PDF files to process for {city}, {state}")
+        
+        if not pdf_files:
+            return {
+                "success": False,
+                "message": f"No PDF files found for {city}, {state} in {pdf_dir}",
+                "extracted_count": 0
+            }
+        
+        # Check the extractor can be set up before starting any workers; each
+        # worker builds its own, so a failure here would otherwise fail every file
+        if not setup_extractor(state, city):
+            return {
+                "success": False,
+                "message": "Failed to initialize PDF extractor",
+                "extracted_count": 0
+            }
+        
+        # Skip PDFs that have not changed since their last extraction
+        manifest = {} if force else _load_manifest(output_dir)
+        pending = []
+        signatures = []
+        for pdf_file in pdf_files:
+            stat = pdf_file.stat()
+            if _is_unchanged(pdf_file.name, stat, _output_path(pdf_file, output_dir), manifest):
+                continue
+            pending.append(pdf_file)
+            signatures.append([stat.st_mtime_ns, stat.st_size])
+        
+        skipped_count = len(pdf_files) - len(pending)
+        if skipped_count:
+            logger.info(f"Skipping {skipped_count} unchanged PDF files")
+        
+        # Process PDFs in parallel, overlapping extraction with writing results
+        successful_extractions = 0
+        failed_extractions = []
+        
+        if pending:
+            workers = _get_max_workers(len(pending), max_workers)
+            logger.info(f"Extracting with {workers} worker processes")
+            outcomes = asyncio.run(_run_pipeline(pending, output_dir, state, city, workers))
+            for pdf_file, signature, outcome in zip(pending, signatures, outcomes):
+                if outcome["success"]:
+                    successful_extractions += 1
+                    manifest[pdf_file.name] = signature
+                else:
+                    failed_extractions.append({
+                        "file": outcome["file"],
+                        "error": outcome["error"]
+                    })
+            
+            _save_manifest(output_dir, manifest)
+        
+        # Return summary
+        return {
+            "success": True,
+            "message": f"Processed {len(pdf_files)} PDF files for {city}, {state}",
+            "extracted_count": successful_extractions,
+            "skipped_count": skipped_count,
+            "failed_count": len(failed_extractions),
+            "failed_files": failed_extractions
+        }
+        
+    except Exception as e:
+        logger.error(f"Error extracting PDFs: {str(e)}")
+        return {
+            "success": False,
+            "message": f"Error extracting PDFs: {str(e)}",
+            "extracted_count": 0
+        }
+
+def main():
+    """Main entry point for the script."""
+    parser = argparse.ArgumentParser(description="Extract content from PDF files.")
+    parser.add_argument("--state", required=True, help="State name for the jurisdiction")
+    parser.add_argument("--city", required=True, help="City name for the jurisdiction")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Number of worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-extract PDFs even if they are unchanged since the last run")
+    
+    args = parser.parse_args()
+    
+    state = args.state
+    city = args.city
+    
+    logger.info(f"Starting PDF extraction for {city}, {state}")
+    result = extract_pdfs(state, city, max_workers=args.workers, force=args.force)
+    
+    if result["success"]:
+        logger.info(f"Extraction completed successfully: {result['extracted_count']} files processed")
+    else:
+        logger.error(f"Extraction failed: {result['message']}")
+
+if __name__ == "__main__":
+    main()
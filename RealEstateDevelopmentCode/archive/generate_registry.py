@@ -0,0 +1,804 @@
+#!/usr/bin/env python3
+"""
+Registry Generation Tool
+
+This script integrates the Document Registry system with existing TOC analysis
+to generate authoritative document registries from alignment analysis results.
+"""
+
+import os
+import sys
+import json
+import hashlib
+import logging
+import argparse
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Errors that mean a PDF content file's metadata could not be read; JSON decode
+# errors from json and orjson are ValueErrors, ijson's are not
+METADATA_READ_ERRORS = (OSError, ValueError, AttributeError)
+if ijson is not None:
+    METADATA_READ_ERRORS += (ijson.JSONError,)
+
+# Add the scripts directory to the path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+try:
+    from RealEstateDevelopmentCode.scripts.common.document_registry import DocumentRegistry
+    from RealEstateDevelopmentCode.scripts.common.config import get_jurisdiction_dirs, ensure_jurisdiction_dirs
+except ImportError as e:
+    print(f"Error importing required modules: {e}")
+    print("Please ensure you're running from the correct directory.")
+    
+    # Fallback configuration
+    class DocumentRegistry:
+        pass
+
+
+# Version recorded in generated registries; bump it when the output format
+# changes so that registries built from unchanged inputs are regenerated
+GENERATOR_VERSION = "1.0.0"
+
+# Sources recorded in the master registry metadata
+REGISTRY_DATA_SOURCES = ("document_registry_analysis", "toc_analysis_enhanced", "file_system_scan")
+
+# Top-level sections every master registry must contain, in report order
+REQUIRED_REGISTRY_SECTIONS = ("metadata", "statistics", "verified_documents", "issues")
+
+# Fields of a TOC entry fetched together in the categorization and document loops
+_get_type_and_number = itemgetter("type", "number")
+_get_type_number_and_title = itemgetter("type", "number", "title")
+
+# Alignment score (percent) below which an alignment improvement is recommended
+TARGET_ALIGNMENT_SCORE = 95
+
+# Recommendation action items; {doc_type} is filled in per document type
+MISSING_DOCUMENT_ACTIONS = (
+    "Review TOC entries for {doc_type} documents",
+    "Check for misfiled or differently named {doc_type} files",
+    "Verify if {doc_type} documents are pending creation",
+    "Update TOC if {doc_type} entries are outdated"
+)
+ORPHANED_WITH_MATCHES_ACTIONS = (
+    "Review potential matches and verify correct associations",
+    "Rename files if needed to match TOC naming conventions",
+    "Add missing TOC entries if documents are valid",
+    "Consolidate duplicate or outdated versions"
+)
+ORPHANED_NO_MATCHES_ACTIONS = (
+    "Determine if files are outdated versions",
+    "Check if files represent new documents needing TOC entries",
+    "Archive or remove obsolete files",
+    "Review file naming conventions"
+)
+ALIGNMENT_ACTIONS = (
+    "Address all missing document issues",
+    "Resolve orphaned file associations",
+    "Standardize naming conventions",
+    "Implement regular validation checks"
+)
+
+# Existing TOC analysis report filenames, in order of preference
+ANALYSIS_REPORT_FILENAMES = ("toc_analysis_enhanced.json", "toc_analysis.json")
+
+
+def _json_load(path: Path) -> Any:
+    """Load a JSON file with a single unbuffered read, using orjson when available."""
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _load_file_metadata(path: Path) -> Dict[str, Any]:
+    """
+    Load the top-level "metadata" object of a PDF content JSON file.
+    
+    With ijson available the file is stream-parsed and parsing stops as soon
+    as the metadata object is complete, so the page content is never built
+    into Python objects. Otherwise the whole file is loaded.
+    """
+    if ijson is not None:
+        with open(path, 'rb') as f:
+            # use_float keeps numbers JSON-serializable (ijson defaults to Decimal)
+            return next(ijson.items(f, 'metadata', use_float=True), {})
+    return _json_load(path).get("metadata", {})
+
+
+def _content_file_signature(path: Path) -> List[Any]:
+    """Get a content file's name, size and mtime, with None for a missing file."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return [path.name, None, None]
+    return [path.name, stat.st_size, stat.st_mtime_ns]
+
+
+def _registry_inputs_hash(registry: DocumentRegistry) -> str:
+    """
+    Hash the analysis results a master registry is generated from.
+    
+    The registry also embeds metadata read from each matched content file,
+    so those files' sizes and mtimes are included; re-extracting a PDF then
+    changes the hash.
+    """
+    filenames = dict.fromkeys(match["matched_file"] for match in registry.matched_documents)
+    inputs = [
+        registry.toc_entries,
+        registry.available_files,
+        registry.matched_documents,
+        registry.missing_documents,
+        registry.orphaned_files,
+        [_content_file_signature(registry.pdf_content_dir / filename) for filename in filenames]
+    ]
+    if orjson is not None:
+        data = orjson.dumps(inputs, default=str,
+                            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(inputs, default=str, sort_keys=True).encode('utf-8')
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _json_dump(obj: Any, path: Path) -> None:
+    """Write an object to a file as indented UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    path.write_bytes(data)
+
+
+class RegistryGenerator:
+    """
+    Enhanced registry generator that integrates with existing TOC analysis
+    and creates comprehensive document registries.
+    """
+    
+    def __init__(self, state: str, city: str):
+        """
+        Initialize the registry generator.
+        
+        Args:
+            state: State name
+            city: City name
+        """
+        self.state = state
+        self.city = city.lower()
+        self.logger = logging.getLogger(f"registry_generator.{state}.{city}")
+        
+        # Ensure directories exist
+        try:
+            self.dirs = ensure_jurisdiction_dirs(state, city)
+        except (NameError, OSError):
+            # Fallback directory setup, when the config module failed to import
+            # or could not create the configured directories
+            self.data_root = Path("/workspace/data")
+            self.dirs = {
+                "registry": self.data_root / "registry" / state / city.lower(),
+                "reports": self.data_root / "reports" / state / city.lower(),
+                "pdf_content": self.data_root / "pdf_content" / state / city.lower()
+            }
+            for dir_path in self.dirs.values():
+                dir_path.mkdir(parents=True, exist_ok=True)
+        
+        # File paths
+        self.registry_dir = self.dirs["registry"]
+        self.reports_dir = self.dirs["reports"]
+        
+        # Enhanced TOC analysis integration
+        self.enhanced_toc_analysis_file = Path("/workspace/data/analyze_toc_enhanced.py")
+        self.existing_reports_dir = Path("/workspace/data/reports") / state / city.lower()
+        
+        # Registry files
+        self.master_registry_file = self.registry_dir / "master_document_registry.json"
+        self.validation_report_file = self.registry_dir / "registry_validation_report.json"
+        self.integration_log_file = self.registry_dir / "integration_log.json"
+        
+        # Filenames found in each scanned reports directory
+        self._report_dir_listings: Dict[Path, set] = {}
+        
+        # File metadata by filename, so files shared by several matches are read once
+        self._metadata_cache: Dict[str, Dict[str, Any]] = {}
+    
+    def integrate_with_existing_analysis(self) -> bool:
+        """
+        Integrate with existing TOC analysis results.
+        
+        Returns:
+            bool: True if integration successful
+        """
+        try:
+            self.logger.info("Integrating with existing TOC analysis...")
+            
+            # Check for existing analysis results
+            existing_results = self._load_existing_analysis_results()
+            
+            if existing_results:
+                self.logger.info(f"Found existing analysis results with {len(existing_results)} entries")
+                return True
+            else:
+                self.logger.info("No existing analysis results found, proceeding with fresh analysis")
+                return True
+                
+        except Exception as e:
+            self.logger.error(f"Error integrating with existing analysis: {e}")
+            return False
+    
+    def _list_report_dir(self, directory: Path) -> set:
+        """List the regular files in a reports directory, scanning it at most once."""
+        listing = self._report_dir_listings.get(directory)
+        if listing is None:
+            try:
+                with os.scandir(directory) as entries:
+                    listing = {entry.name for entry in entries if entry.is_file()}
+            except FileNotFoundError:
+                listing = set()
+            self._report_dir_listings[directory] = listing
+        return listing
+    
+    def _load_existing_analysis_results(self) -> Optional[List[Dict[str, Any]]]:
+        """Load existing TOC analysis results if available."""
+        try:
+            # Look for existing reports in common locations, one directory scan each
+            potential_files = [
+                directory / filename
+                for directory in (self.existing_reports_dir, self.reports_dir)
+                for filename in ANALYSIS_REPORT_FILENAMES
+                if filename in self._list_report_dir(directory)
+            ]
+            
+            for report_file in potential_files:
+                self.logger.info("Loading existing analysis from: %s", report_file)
+                data = _json_load(report_file)
+                
+                # Extract relevant entries
+                if "toc_entries" in data:
+                    return data["toc_entries"]
+                elif "analysis_results" in data:
+                    return data["analysis_results"]
+                elif isinstance(data, list):
+                    return data
+            
+            return None
+            
+        except Exception as e:
+            self.logger.error(f"Error loading existing analysis results: {e}")
+            return None
+    
+    def run_enhanced_toc_analysis(self) -> bool:
+        """
+        Run the enhanced TOC analysis script if available.
+        
+        Returns:
+            bool: True if analysis ran successfully
+        """
+        try:
+            if not self.enhanced_toc_analysis_file.exists():
+                self.logger.warning("Enhanced TOC analysis script not found")
+                return False
+            
+            self.logger.info("Running enhanced TOC analysis...")
+            
+            # Import and run the enhanced analysis in this process, avoiding
+            # the startup cost of a second interpreter
+            import importlib.util
+            
+            try:
+                spec = importlib.util.spec_from_file_location(
+                    "analyze_toc_enhanced", self.enhanced_toc_analysis_file
+                )
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                module.main()
+                
+                self.logger.info("Enhanced TOC analysis completed successfully")
+                return True
+                
+            except (Exception, SystemExit) as e:
+                self.logger.warning(f"In-process TOC analysis failed ({e}), retrying in a subprocess")
+                return self._run_enhanced_toc_analysis_subprocess()
+                
+        except Exception as e:
+            self.logger.error(f"Error running enhanced TOC analysis: {e}")
+            return False
+    
+    def _run_enhanced_toc_analysis_subprocess(self) -> bool:
+        """Run the enhanced TOC analysis script in an isolated Python process."""
+        import subprocess
+        
+        # Run from the data directory via cwd= rather than a process-wide chdir
+        result = subprocess.run([
+            sys.executable, 
+            str(self.enhanced_toc_analysis_file)
+        ], cwd=str(self.enhanced_toc_analysis_file.parent),
+           capture_output=True, text=True, timeout=300)
+        
+        if result.returncode == 0:
+            self.logger.info("Enhanced TOC analysis completed successfully")
+            return True
+        else:
+            self.logger.error(f"Enhanced TOC analysis failed: {result.stderr}")
+            return False
+    
+    def _existing_registry_matches(self, inputs_hash: str) -> bool:
+        """Check whether the saved master registry was generated from the same inputs."""
+        if not self.master_registry_file.exists():
+            return False
+        try:
+            metadata = _load_file_metadata(self.master_registry_file)
+        except METADATA_READ_ERRORS:
+            return False
+        return (metadata.get("inputs_hash") == inputs_hash
+                and metadata.get("generator_version") == GENERATOR_VERSION)
+    
+    def generate_master_registry(self, registry: DocumentRegistry, force: bool = False) -> bool:
+        """
+        Generate a comprehensive master document registry.
+        
+        Args:
+            registry: DocumentRegistry instance with analysis results
+            force: Regenerate even if the saved registry was built from the same inputs
+            
+        Returns:
+            bool: True if registry generated successfully
+        """
+        try:
+            # Skip regeneration when the analysis results are unchanged
+            inputs_hash = _registry_inputs_hash(registry)
+            if not force and self._existing_registry_matches(inputs_hash):
+                self.logger.info(f"Master registry is up to date: {self.master_registry_file}")
+                return True
+            
+            self.logger.info("Generating master document registry...")
+            
+            # Constant for the whole generation run, so computed once and shared
+            timestamp = datetime.now().isoformat()
+            alignment_score = registry._calculate_alignment_score()
+            total_available_files = sum(len(files) for files in registry.available_files.values())
+            
+            # Build comprehensive registry data
+            master_registry = {
+                "metadata": {
+                    "generated_at": timestamp,
+                    "generator_version": GENERATOR_VERSION,
+                    "inputs_hash": inputs_hash,
+                    "jurisdiction": {
+                        "state": self.state,
+                        "city": self.city
+                    },
+                    "data_sources": list(REGISTRY_DATA_SOURCES)
+                },
+                "statistics": {
+                    "total_toc_entries": len(registry.toc_entries),
+                    "total_available_files": total_available_files,
+                    "matched_documents": len(registry.matched_documents),
+                    "missing_documents": len(registry.missing_documents),
+                    "orphaned_files": len(registry.orphaned_files),
+                    "alignment_score": alignment_score
+                },
+                "document_categories": self._categorize_documents(registry),
+                "verified_documents": self._build_verified_documents_list(registry, timestamp),
+                "issues": {
+                    "missing_documents": registry.missing_documents,
+                    "orphaned_files": registry.orphaned_files,
+                    "recommendations": self._generate_comprehensive_recommendations(registry, alignment_score)
+                },
+                "validation": {
+                    "last_validated": timestamp,
+                    "validation_status": "pending",
+                    "validation_checks": []
+                },
+                "integration_status": {
+                    "toc_integration": "completed",
+                    "file_system_integration": "completed",
+                    "cross_reference_validation": "pending"
+                }
+            }
+            
+            # Save master registry
+            _json_dump(master_registry, self.master_registry_file)
+            
+            self.logger.info(f"Master registry saved to: {self.master_registry_file}")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Error generating master registry: {e}")
+            return False
+    
+    def _categorize_documents(self, registry: DocumentRegistry) -> Dict[str, Any]:
+        """Categorize documents by type and status."""
+        by_type = defaultdict(lambda: {"total": 0, "verified": 0, "missing": 0, "numbers": []})
+        by_section = defaultdict(lambda: {"total": 0, "verified": 0, "subsections": []})
+        
+        # Categorize by document type, and sections by section number, in one pass
+        for entry in registry.toc_entries:
+            doc_type, number = _get_type_and_number(entry)
+            
+            type_stats = by_type[doc_type]
+            type_stats["total"] += 1
+            type_stats["numbers"].append(number)
+            
+            if doc_type == "section":
+                section_stats = by_section[number.partition('.')[0]]
+                section_stats["total"] += 1
+                section_stats["subsections"].append(number)
+        
+        # Update verified counts
+        for match in registry.matched_documents:
+            by_type[match["toc_entry"]["type"]]["verified"] += 1
+        
+        # Update missing counts
+        for missing in registry.missing_documents:
+            by_type[missing["toc_entry"]["type"]]["missing"] += 1
+        
+        return {
+            "by_type": dict(by_type),
+            "by_status": {
+                "verified": len(registry.matched_documents),
+                "missing": len(registry.missing_documents),
+                "orphaned": len(registry.orphaned_files)
+            },
+            "by_section": dict(by_section)
+        }
+    
+    def _build_verified_documents_list(self, registry: DocumentRegistry,
+                                       timestamp: str) -> List[Dict[str, Any]]:
+        """Build a comprehensive list of verified documents, stamped as verified at timestamp."""
+        verified_docs = []
+        matches = registry.matched_documents
+        if not matches:
+            return verified_docs
+        
+        # Metadata reads are I/O bound, so fan them out across threads, reading
+        # each distinct file once
+        filenames = list(dict.fromkeys(match["matched_file"] for match in matches))
+        with ThreadPoolExecutor(max_workers=min(32, len(filenames))) as executor:
+            file_metadata = dict(zip(filenames, executor.map(
+                lambda filename: self._extract_file_metadata(registry, filename),
+                filenames
+            )))
+        
+        for match in matches:
+            toc_entry = match["toc_entry"]
+            doc_type, number, title = _get_type_number_and_title(toc_entry)
+            filename = match["matched_file"]
+            
+            doc = {
+                "document_id": f"{doc_type}-{number}",
+                "type": doc_type,
+                "number": number,
+                "title": title,
+                "filename": filename,
+                "match_confidence": match["match_confidence"],
+                "match_method": match["match_method"],
+                "toc_reference": {
+                    "page": toc_entry.get("page"),
+                    "section_reference": toc_entry.get("section_reference")
+                },
+                "file_metadata": file_metadata[filename],
+                "verification_status": "verified",
+                "last_verified": timestamp
+            }
+            
+            verified_docs.append(doc)
+        
+        return verified_docs
+    
+    def _extract_file_metadata(self, registry: DocumentRegistry, filename: str) -> Dict[str, Any]:
+        """Extract metadata from the document file, caching the result by filename."""
+        cached = self._metadata_cache.get(filename)
+        if cached is not None:
+            return cached
+        
+        file_metadata = {}
+        try:
+            file_path = registry.pdf_content_dir / filename
+            if file_path.exists():
+                metadata = _load_file_metadata(file_path)
+                
+                file_metadata = {
+                    "extracted_at": metadata.get("extracted_at"),
+                    "num_pages": metadata.get("num_pages"),
+                    "title": metadata.get("title"),
+                    "author": metadata.get("author"),
+                    "creation_date": metadata.get("creation_date"),
+                    "modification_date": metadata.get("modification_date")
+                }
+        except METADATA_READ_ERRORS:
+            pass
+        
+        self._metadata_cache[filename] = file_metadata
+        return file_metadata
+    
+    def _generate_comprehensive_recommendations(self, registry: DocumentRegistry,
+                                                alignment_score: float) -> List[Dict[str, Any]]:
+        """Generate comprehensive recommendations for resolving issues."""
+        recommendations = []
+        
+        # Healthy registry: no issues to resolve and nothing else to build
+        if (not registry.missing_documents and not registry.orphaned_files
+                and alignment_score >= TARGET_ALIGNMENT_SCORE):
+            return recommendations
+        
+        # Recommendations for missing documents
+        if registry.missing_documents:
+            missing_by_type = Counter(doc["toc_entry"]["type"] for doc in registry.missing_documents)
+            
+            for doc_type, count in missing_by_type.items():
+                recommendations.append({
+                    "type": "missing_documents",
+                    "priority": "high",
+                    "category": doc_type,
+                    "count": count,
+                    "description": f"Locate or create {count} missing {doc_type} documents",
+                    "action_items": [action.format(doc_type=doc_type) for action in MISSING_DOCUMENT_ACTIONS]
+                })
+        
+        # Recommendations for orphaned files
+        if registry.orphaned_files:
+            orphaned_with_matches = []
+            orphaned_without_matches = []
+            for f in registry.orphaned_files:
+                (orphaned_with_matches if f.get("potential_toc_matches") else orphaned_without_matches).append(f)
+            
+            if orphaned_with_matches:
+                recommendations.append({
+                    "type": "orphaned_files_with_matches",
+                    "priority": "medium",
+                    "category": "file_organization",
+                    "count": len(orphaned_with_matches),
+                    "description": f"Review {len(orphaned_with_matches)} orphaned files with potential TOC matches",
+                    "action_items": list(ORPHANED_WITH_MATCHES_ACTIONS)
+                })
+            
+            if orphaned_without_matches:
+                recommendations.append({
+                    "type": "orphaned_files_no_matches",
+                    "priority": "low",
+                    "category": "file_cleanup",
+                    "count": len(orphaned_without_matches),
+                    "description": f"Investigate {len(orphaned_without_matches)} orphaned files with no TOC matches",
+                    "action_items": list(ORPHANED_NO_MATCHES_ACTIONS)
+                })
+        
+        # Alignment score recommendations
+        if alignment_score < TARGET_ALIGNMENT_SCORE:
+            recommendations.append({
+                "type": "alignment_improvement",
+                "priority": "high",
+                "category": "data_quality",
+                "count": 1,
+                "description": f"Improve overall alignment score from {alignment_score:.1f}% to {TARGET_ALIGNMENT_SCORE}%+",
+                "action_items": list(ALIGNMENT_ACTIONS)
+            })
+        
+        return recommendations
+    
+    def validate_registry(self) -> bool:
+        """
+        Perform validation checks on the generated registry.
+        
+        Returns:
+            bool: True if validation passed
+        """
+        try:
+            self.logger.info("Validating generated registry...")
+            
+            if not self.master_registry_file.exists():
+                self.logger.error("Master registry file not found")
+                return False
+            
+            # Load the registry
+            registry_data = _json_load(self.master_registry_file)
+            
+            validation_results = {
+                "validation_timestamp": datetime.now().isoformat(),
+                "checks": [],
+                "overall_status": "passed",
+                "warnings": [],
+                "errors": []
+            }
+            
+            # Check 1: Required sections present
+            missing_sections = set(REQUIRED_REGISTRY_SECTIONS) - registry_data.keys()
+            validation_results["checks"].extend(
+                {
+                    "check": f"required_section_{section}",
+                    "status": "failed",
+                    "message": f"Required section '{section}' is missing"
+                } if section in missing_sections else {
+                    "check": f"required_section_{section}",
+                    "status": "passed",
+                    "message": f"Required section '{section}' is present"
+                }
+                for section in REQUIRED_REGISTRY_SECTIONS
+            )
+            if missing_sections:
+                validation_results["errors"].extend(
+                    f"Missing required section: {section}"
+                    for section in REQUIRED_REGISTRY_SECTIONS if section in missing_sections
+                )
+                validation_results["overall_status"] = "failed"
+            
+            # Check 2: Data consistency
+            stats = registry_data.get("statistics", {})
+            verified_docs = registry_data.get("verified_documents", [])
+            
+            if len(verified_docs) == stats.get("matched_documents", 0):
+                validation_results["checks"].append({
+                    "check": "verified_documents_count",
+                    "status": "passed",
+                    "message": "Verified documents count matches statistics"
+                })
+            else:
+                validation_results["checks"].append({
+                    "check": "verified_documents_count",
+                    "status": "failed",
+                    "message": "Verified documents count doesn't match statistics"
+                })
+                validation_results["errors"].append("Data inconsistency in verified documents count")
+                validation_results["overall_status"] = "failed"
+            
+            # Check 3: Alignment score validation
+            alignment_score = stats.get("alignment_score", 0)
+            if 0 <= alignment_score <= 100:
+                validation_results["checks"].append({
+                    "check": "alignment_score_range",
+                    "status": "passed",
+                    "message": f"Alignment score {alignment_score}% is within valid range"
+                })
+            else:
+                validation_results["checks"].append({
+                    "check": "alignment_score_range",
+                    "status": "failed",
+                    "message": f"Alignment score {alignment_score}% is outside valid range"
+                })
+                validation_results["errors"].append("Invalid alignment score")
+                validation_results["overall_status"] = "failed"
+            
+            # Save validation report
+            _json_dump(validation_results, self.validation_report_file)
+            
+            # Log results
+            if validation_results["overall_status"] == "passed":
+                self.logger.info("Registry validation passed")
+                return True
+            else:
+                self.logger.error(f"Registry validation failed with {len(validation_results['errors'])} errors")
+                for error in validation_results["errors"]:
+                    self.logger.error("  - %s", error)
+                return False
+                
+        except Exception as e:
+            self.logger.error(f"Error during registry validation: {e}")
+            return False
+    
+    def run_full_generation(self, force: bool = False) -> bool:
+        """
+        Run the complete registry generation workflow.
+        
+        Args:
+            force: Regenerate the master registry even if its inputs are unchanged
+            
+        Returns:
+            bool: True if generation completed successfully
+        """
+        self.logger.info(f"Starting registry generation for {self.state}/{self.city}")
+        
+        # Step 1: Integration with existing analysis
+        if not self.integrate_with_existing_analysis():
+            self.logger.error("Failed to integrate with existing analysis")
+            return False
+        
+        # Step 2: Run Document Registry analysis
+        try:
+            registry = DocumentRegistry(self.state, self.city)
+            if not registry.run_full_analysis():
+                self.logger.error("Failed to run document registry analysis")
+                return False
+        except Exception as e:
+            self.logger.error(f"Error creating document registry: {e}")
+            return False
+        
+        # Step 3: Generate master registry
+        if not self.generate_master_registry(registry, force=force):
+            self.logger.error("Failed to generate master registry")
+            return False
+        
+        # Step 4: Validate registry
+        if not self.validate_registry():
+            self.logger.error("Registry validation failed")
+            return False
+        
+        self.logger.info("Registry generation completed successfully")
+        return True
+
+
+def main():
+    """Main function for command-line usage."""
+    parser = argparse.ArgumentParser(
+        description="Registry Generation Tool",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s                           # Generate registry for Oregon/Gresham
+  %(prog)s --state Oregon --city Portland  # Generate for Oregon/Portland
+  %(prog)s --verbose                 # Enable verbose logging
+  %(prog)s --force                   # Regenerate even if inputs are unchanged
+        """
+    )
+    
+    parser.add_argument(
+        "--state", 
+        default="Oregon", 
+        help="State name (default: Oregon)"
+    )
+    
+    parser.add_argument(
+        "--city", 
+        default="Gresham", 
+        help="City name (default: Gresham)"
+    )
+    
+    parser.add_argument(
+        "--verbose", "-v", 
+        action="store_true", 
+        help="Enable verbose logging"
+    )
+    
+    parser.add_argument(
+        "--force", 
+        action="store_true", 
+        help="Regenerate the master registry even if its inputs are unchanged"
+    )
+    
+    args = parser.parse_args()
+    
+    # Configure logging
+    level = logging.DEBUG if args.verbose else logging.INFO
+    logging.basicConfig(
+        level=level,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    
+    try:
+        # Run registry generation
+        generator = RegistryGenerator(args.state, args.city)
+        success = generator.run_full_generation(force=args.force)
+        
+        if success:
+            print(f"\n✓ Registry generation completed successfully!")
+            print(f"Master registry saved to: {generator.master_registry_file}")
+            print(f"Validation report saved to: {generator.validation_report_file}")
+        else:
+            print("Registry generation failed!")
+            return 1
+        
+        return 0
+        
+    except KeyboardInterrupt:
+        print("\nRegistry generation interrupted by user.")
+        return 1
+    
+    except Exception as e:
+        print(f"Unexpected error: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
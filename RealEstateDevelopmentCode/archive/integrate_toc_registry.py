@@ -0,0 +1,905 @@
+#!/usr/bin/env python3
+"""
+Integration bridge between the new Document Registry system and existing TOC analysis.
+This script enhances the existing analyze_toc_enhanced.py functionality while maintaining
+compatibility with current workflows.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import json
+import asyncio
+import hashlib
+import logging
+import threading
+import uuid
+import importlib.util
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
+from datetime import datetime
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Add script paths for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+if TYPE_CHECKING:
+    from RealEstateDevelopmentCode.scripts.common.document_registry import DocumentRegistry
+
+# Seconds to wait for the existing TOC analysis, in process or as a subprocess
+EXISTING_ANALYSIS_TIMEOUT = 300
+
+# Seconds to wait for the registry analysis, the same limit as the existing analysis
+REGISTRY_ANALYSIS_TIMEOUT = 300
+
+
+@lru_cache(maxsize=None)
+def _load_registry_cls():
+    """Import the DocumentRegistry class on first use, once per process."""
+    from RealEstateDevelopmentCode.scripts.common.document_registry import DocumentRegistry
+    return DocumentRegistry
+
+
+def _json_load(path: Path) -> Any:
+    """Load a JSON file with a single read, using orjson when available."""
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _json_dumps(obj: Any, indent: bool = True) -> bytes:
+    """Serialize an object as UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def _json_dump(obj: Any, path: Path, indent: bool = True) -> None:
+    """Write an object to a file as UTF-8 JSON, using orjson when available."""
+    path.write_bytes(_json_dumps(obj, indent))
+
+
+@lru_cache(maxsize=None)
+def _load_analysis_module(path: Path):
+    """Import the TOC analysis script as a module, once per process."""
+    spec = importlib.util.spec_from_file_location("analyze_toc_enhanced", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+async def _run_in_daemon_thread(func, *args):
+    """
+    Run a blocking call on a daemon thread and await its result.
+    
+    Unlike asyncio.to_thread, a call that never returns does not keep the
+    event loop or the process from exiting once the caller stops waiting.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def settle(result, error):
+        if future.done():
+            return
+        if error is None:
+            future.set_result(result)
+        else:
+            future.set_exception(error)
+    
+    def run():
+        result, error = None, None
+        try:
+            result = func(*args)
+        except BaseException as e:
+            error = e
+        try:
+            loop.call_soon_threadsafe(settle, result, error)
+        except RuntimeError:
+            # The event loop closed after the caller gave up waiting
+            pass
+    
+    threading.Thread(target=run, daemon=True).start()
+    return await future
+
+
+def _sorted_file_lists(files: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """Copy a category -> files mapping with categories and file names in sorted order."""
+    return {category: sorted(files[category]) for category in sorted(files)}
+
+
+@dataclass(frozen=True, slots=True)
+class ComparisonSummary:
+    """The differences between the two analyses that the assessment is based on"""
+    toc_diff: int
+    match_diff: int
+    # (category, files only in existing, files only in registry) per category
+    file_diffs: Tuple[Tuple[str, int, int], ...]
+
+
+class TOCRegistryIntegrator:
+    """
+    Integration bridge that connects the new Document Registry system
+    with existing TOC analysis functionality.
+    """
+    
+    def __init__(self, state: str = "Oregon", city: str = "Gresham"):
+        """Initialize the integrator."""
+        self.state = state
+        self.city = city.lower()
+        self.logger = logging.getLogger(f"toc_registry_integrator.{state}.{city}")
+        
+        # Data directories
+        self.data_root = Path("/workspace/data")
+        self.pdf_content_dir = self.data_root / "pdf_content" / state / self.city
+        self.reports_dir = self.data_root / "reports" / state / self.city
+        self.registry_dir = self.data_root / "registry" / state / self.city
+        
+        # Ensure directories exist
+        for dir_path in [self.reports_dir, self.registry_dir]:
+            dir_path.mkdir(parents=True, exist_ok=True)
+        
+        # File paths
+        self.toc_file = self.pdf_content_dir / "dc-table-of-contents.json"
+        self.enhanced_analysis_file = self.data_root / "analyze_toc_enhanced.py"
+        
+        # Output files
+        self.integrated_report_file = self.reports_dir / "integrated_toc_analysis.json"
+        self.comparison_report_file = self.reports_dir / "analysis_comparison.json"
+        
+        # Cached integration results, keyed by a hash of the analysis inputs
+        self.cache_index_file = self.registry_dir / "cache_index.json"
+        
+        # Most recently generated integrated report
+        self.integrated_report: Optional[Dict[str, Any]] = None
+    
+    def _compute_inputs_hash(self) -> str:
+        """
+        Hash the inputs of an integration run.
+        
+        Covers the TOC file contents, the name, size and mtime of every PDF
+        content JSON file, and the mtime of the analysis script.
+        """
+        digest = hashlib.sha256()
+        
+        try:
+            digest.update(self.toc_file.read_bytes())
+        except FileNotFoundError:
+            pass
+        
+        content_files = []
+        try:
+            with os.scandir(self.pdf_content_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json"):
+                        stat = entry.stat()
+                        content_files.append((entry.name, stat.st_size, stat.st_mtime_ns))
+        except FileNotFoundError:
+            pass
+        for name, size, mtime_ns in sorted(content_files):
+            digest.update(f"{name}\0{size}\0{mtime_ns}\n".encode("utf-8"))
+        
+        try:
+            digest.update(str(self.enhanced_analysis_file.stat().st_mtime_ns).encode("utf-8"))
+        except FileNotFoundError:
+            pass
+        
+        return digest.hexdigest()
+    
+    def _load_cached_integration(self, inputs_hash: str) -> Optional[Dict[str, Any]]:
+        """Load the cached results of a previous run with the same inputs, if any."""
+        try:
+            cache_file = _json_load(self.cache_index_file).get(inputs_hash)
+            if not cache_file:
+                return None
+            return _json_load(self.registry_dir / cache_file)
+        except (OSError, ValueError, AttributeError):
+            return None
+    
+    def _save_cached_integration(self, inputs_hash: str, integrated_report: Dict[str, Any],
+                                 comparison: Dict[str, Any]) -> None:
+        """Cache the results of this run, replacing the previous cache entry."""
+        cache_file = f"cache_{inputs_hash[:16]}.json"
+        try:
+            _json_dump({"integrated_report": integrated_report, "comparison": comparison},
+                       self.registry_dir / cache_file, indent=False)
+            
+            # Only the latest inputs are kept, so drop the previous entry's file
+            try:
+                previous_files = set(_json_load(self.cache_index_file).values()) - {cache_file}
+            except (OSError, ValueError, AttributeError):
+                previous_files = set()
+            
+            _json_dump({inputs_hash: cache_file}, self.cache_index_file, indent=False)
+            
+            for previous_file in previous_files:
+                (self.registry_dir / previous_file).unlink(missing_ok=True)
+        except OSError as e:
+            self.logger.warning(f"Could not cache integration results: {e}")
+        
+    def run_existing_analysis(self) -> Optional[Dict[str, Any]]:
+        """
+        Run the existing analyze_toc_enhanced.py analysis and capture results.
+        
+        The analysis is imported and run in this process, and its results are
+        used directly. If that fails, the script is run in a subprocess and its
+        saved reports are loaded instead.
+        
+        Returns:
+            Dictionary containing the analysis results, or None if failed
+        """
+        try:
+            self.logger.info("Running existing TOC analysis...")
+            
+            # Check if the enhanced analysis script exists
+            if not self.enhanced_analysis_file.exists():
+                self.logger.warning(f"Enhanced analysis script not found: {self.enhanced_analysis_file}")
+                return None
+            
+            try:
+                results = _load_analysis_module(self.enhanced_analysis_file).analyze()
+            except (Exception, SystemExit) as e:
+                self.logger.warning(f"In-process analysis failed ({e}), retrying in a subprocess")
+                return self._run_existing_analysis_subprocess()
+            
+            if results is None:
+                self.logger.error("Existing analysis failed")
+                return None
+            
+            self.logger.info("Existing analysis completed successfully")
+            return results
+                
+        except Exception as e:
+            self.logger.error(f"Error running existing analysis: {e}")
+            return None
+    
+    def _run_existing_analysis_subprocess(self) -> Optional[Dict[str, Any]]:
+        """Run the existing analysis script in a separate Python process and load its reports."""
+        import subprocess
+        
+        # Run the existing script from the data directory. Its stdout is not
+        # used, and stderr is only decoded if the script fails.
+        result = subprocess.run([
+            sys.executable, 
+            str(self.enhanced_analysis_file)
+        ], cwd=str(self.data_root), stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=EXISTING_ANALYSIS_TIMEOUT)
+        
+        if result.returncode == 0:
+            self.logger.info("Existing analysis completed successfully")
+            
+            # Try to load the generated reports
+            return self._load_existing_analysis_results()
+        else:
+            self.logger.error("Existing analysis failed: %s", result.stderr.decode("utf-8", "replace"))
+            return None
+    
+    def _load_existing_analysis_results(self) -> Optional[Dict[str, Any]]:
+        """Load results from the existing analysis."""
+        try:
+            # Look for generated reports
+            potential_files = [
+                self.reports_dir / "toc_analysis_enhanced.json",
+                self.reports_dir / "toc_analysis.json",
+                self.data_root / "reports" / self.state / self.city / "toc_analysis_enhanced.json"
+            ]
+            
+            for report_file in potential_files:
+                if report_file.exists():
+                    self.logger.info(f"Loading existing results from: {report_file}")
+                    return _json_load(report_file)
+            
+            # If no JSON reports found, try to parse stdout from the script
+            self.logger.warning("No existing analysis JSON reports found")
+            return None
+            
+        except Exception as e:
+            self.logger.error(f"Error loading existing analysis results: {e}")
+            return None
+    
+    def run_registry_analysis(self) -> Optional[DocumentRegistry]:
+        """
+        Run the new Document Registry analysis.
+        
+        Returns:
+            DocumentRegistry instance with results, or None if failed
+        """
+        try:
+            self.logger.info("Running Document Registry analysis...")
+            
+            registry = _load_registry_cls()(self.state, self.city)
+            success = registry.run_full_analysis()
+            
+            if success:
+                self.logger.info("Document Registry analysis completed successfully")
+                return registry
+            else:
+                self.logger.error("Document Registry analysis failed")
+                return None
+                
+        except Exception as e:
+            self.logger.error(f"Error running Document Registry analysis: {e}")
+            return None
+    
+    async def _run_analyses(self):
+        """
+        Run the existing analysis and the registry analysis concurrently.
+        
+        The two analyses are independent, so each runs on its own thread and
+        one's file I/O overlaps the other's work. Neither changes the working
+        directory, so they are safe to run side by side.
+        
+        Returns:
+            Tuple of the existing analysis results and the DocumentRegistry,
+            either of which is None if that analysis failed
+        """
+        return await asyncio.gather(
+            self._run_existing_analysis_with_timeout(),
+            self._run_registry_analysis_with_timeout()
+        )
+    
+    async def _run_existing_analysis_with_timeout(self) -> Optional[Dict[str, Any]]:
+        """
+        Run the existing analysis, giving up after EXISTING_ANALYSIS_TIMEOUT seconds.
+        
+        The analysis runs on a daemon thread, which cannot be interrupted, so a
+        stuck analysis is abandoned rather than stopped.
+        """
+        try:
+            return await asyncio.wait_for(_run_in_daemon_thread(self.run_existing_analysis),
+                                          EXISTING_ANALYSIS_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.logger.error("Existing analysis timed out after %d seconds",
+                              EXISTING_ANALYSIS_TIMEOUT)
+            return None
+    
+    async def _run_registry_analysis_with_timeout(self) -> Optional[DocumentRegistry]:
+        """
+        Run the registry analysis, giving up after REGISTRY_ANALYSIS_TIMEOUT seconds.
+        
+        The analysis runs on a daemon thread, which cannot be interrupted, so a
+        stuck analysis is abandoned rather than stopped.
+        """
+        try:
+            return await asyncio.wait_for(_run_in_daemon_thread(self.run_registry_analysis),
+                                          REGISTRY_ANALYSIS_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.logger.error("Document Registry analysis timed out after %d seconds",
+                              REGISTRY_ANALYSIS_TIMEOUT)
+            return None
+    
+    def compare_analyses(self, existing_results: Dict[str, Any], registry: DocumentRegistry) -> Dict[str, Any]:
+        """
+        Compare results from existing analysis and new registry system.
+        
+        Args:
+            existing_results: Results from existing TOC analysis
+            registry: DocumentRegistry with new analysis results
+            
+        Returns:
+            Comparison report
+        """
+        try:
+            self.logger.info("Comparing analysis results...")
+            
+            comparison = {
+                "comparison_timestamp": datetime.now().isoformat(),
+                "jurisdiction": {"state": self.state, "city": self.city},
+                "analysis_methods": {
+                    "existing_analysis": {
+                        "description": "Enhanced TOC analysis from analyze_toc_enhanced.py",
+                        "results_available": existing_results is not None
+                    },
+                    "registry_analysis": {
+                        "description": "Document Registry system analysis",
+                        "results_available": registry is not None
+                    }
+                },
+                "comparison_results": {}
+            }
+            
+            if existing_results and registry:
+                # Compare TOC entries count
+                existing_toc_count = len(existing_results.get("toc_entries", []))
+                registry_toc_count = len(registry.toc_entries)
+                
+                comparison["comparison_results"]["toc_entries"] = {
+                    "existing_count": existing_toc_count,
+                    "registry_count": registry_toc_count,
+                    "difference": registry_toc_count - existing_toc_count,
+                    "match": existing_toc_count == registry_toc_count
+                }
+                
+                # Compare file counts
+                existing_files = _sorted_file_lists(existing_results.get("available_files", {}))
+                registry_files = _sorted_file_lists(registry.available_files)
+                
+                file_differences = self._compare_file_lists(existing_files, registry_files)
+                comparison["comparison_results"]["available_files"] = {
+                    "existing": existing_files,
+                    "registry": registry_files,
+                    "differences": file_differences
+                }
+                
+                # Compare matching results
+                existing_matches = existing_results.get("matches", [])
+                registry_matches = registry.matched_documents
+                
+                comparison["comparison_results"]["matches"] = {
+                    "existing_count": len(existing_matches),
+                    "registry_count": len(registry_matches),
+                    "difference": len(registry_matches) - len(existing_matches)
+                }
+                
+                # Compare missing documents
+                existing_missing = existing_results.get("missing_documents", [])
+                registry_missing = registry.missing_documents
+                
+                comparison["comparison_results"]["missing_documents"] = {
+                    "existing_count": len(existing_missing),
+                    "registry_count": len(registry_missing),
+                    "difference": len(registry_missing) - len(existing_missing)
+                }
+                
+                # Overall assessment
+                summary = ComparisonSummary(
+                    toc_diff=registry_toc_count - existing_toc_count,
+                    match_diff=len(registry_matches) - len(existing_matches),
+                    file_diffs=tuple(
+                        (category, diff_info["only_in_existing_count"], diff_info["only_in_registry_count"])
+                        for category, diff_info in file_differences.items()
+                    )
+                )
+                comparison["assessment"] = self._assess_comparison_results(summary)
+            
+            return comparison
+            
+        except Exception as e:
+            self.logger.error(f"Error comparing analyses: {e}")
+            return {"error": str(e)}
+    
+    def _compare_file_lists(self, existing_files: Dict, registry_files: Dict) -> Dict[str, Any]:
+        """Compare file lists from both analyses."""
+        differences = {}
+        empty = frozenset()
+        
+        # Build each category's file set once
+        existing_sets = {category: frozenset(files) for category, files in existing_files.items()}
+        registry_sets = {category: frozenset(files) for category, files in registry_files.items()}
+        
+        # Get all categories from both analyses, in a stable order
+        all_categories = sorted(existing_sets.keys() | registry_sets.keys())
+        
+        for category in all_categories:
+            existing_set = existing_sets.get(category, empty)
+            registry_set = registry_sets.get(category, empty)
+            
+            only_in_existing = sorted(existing_set - registry_set)
+            only_in_registry = sorted(registry_set - existing_set)
+            
+            # Sorted so the report is deterministic between runs. The files
+            # common to both are already listed under available_files, so
+            # only their count is kept here.
+            differences[category] = {
+                "existing_count": len(existing_set),
+                "registry_count": len(registry_set),
+                "only_in_existing": only_in_existing,
+                "only_in_registry": only_in_registry,
+                "only_in_existing_count": len(only_in_existing),
+                "only_in_registry_count": len(only_in_registry),
+                "common_count": len(existing_set & registry_set)
+            }
+        
+        return differences
+    
+    def _assess_comparison_results(self, summary: ComparisonSummary) -> Dict[str, Any]:
+        """Assess the comparison results and provide recommendations."""
+        significant_differences = []
+        assessment = {
+            "overall_consistency": "good",
+            "significant_differences": significant_differences,
+            "recommendations": [],
+            "confidence_level": "high"
+        }
+        
+        # Check TOC entries consistency
+        toc_diff = summary.toc_diff
+        if abs(toc_diff) > 2:
+            significant_differences.append(f"TOC entries count differs by {toc_diff}")
+            assessment["overall_consistency"] = "fair"
+            assessment["recommendations"].append("Review TOC parsing differences between methods")
+        
+        # Check file detection consistency, using the counts precomputed by
+        # _compare_file_lists. Every differing category is still listed, since
+        # the list is part of the report.
+        for category, only_existing, only_registry in summary.file_diffs:
+            if only_existing or only_registry:
+                significant_differences.append(
+                    f"{category}: {only_existing} files only in existing, {only_registry} only in registry"
+                )
+        
+        # Check matching consistency
+        match_diff = summary.match_diff
+        if abs(match_diff) > 1:
+            significant_differences.append(f"Matched documents count differs by {match_diff}")
+            assessment["recommendations"].append("Review matching algorithm differences")
+        
+        # Adjust overall assessment based on differences
+        num_differences = len(significant_differences)
+        if num_differences > 3:
+            assessment["overall_consistency"] = "poor"
+            assessment["confidence_level"] = "low"
+            assessment["recommendations"].append("Investigate fundamental differences between analysis methods")
+        elif num_differences > 1:
+            assessment["overall_consistency"] = "fair"
+            assessment["confidence_level"] = "medium"
+        
+        return assessment
+    
+    def generate_integrated_report(self, existing_results: Optional[Dict[str, Any]], 
+                                 registry: Optional[DocumentRegistry],
+                                 comparison: Dict[str, Any]) -> bool:
+        """
+        Generate an integrated report combining both analyses.
+        
+        Args:
+            existing_results: Results from existing analysis
+            registry: DocumentRegistry results
+            comparison: Comparison results
+            
+        Returns:
+            True if report generated successfully
+        """
+        try:
+            self.logger.info("Generating integrated report...")
+            
+            integrated_report = {
+                "report_metadata": {
+                    "generated_at": datetime.now().isoformat(),
+                    "report_type": "integrated_toc_analysis",
+                    "jurisdiction": {"state": self.state, "city": self.city},
+                    "integration_version": "1.0.0"
+                },
+                "data_sources": {
+                    "existing_analysis": {
+                        "available": existing_results is not None,
+                        "source": "analyze_toc_enhanced.py",
+                        "results": existing_results if existing_results else None
+                    },
+                    "registry_analysis": {
+                        "available": registry is not None,
+                        "source": "Document Registry system",
+                        "results": self._extract_registry_summary(registry) if registry else None
+                    }
+                },
+                "comparison_analysis": comparison,
+                "recommendations": self._generate_integrated_recommendations(existing_results, registry, comparison),
+                "next_steps": self._generate_next_steps(comparison)
+            }
+            
+            self.integrated_report = integrated_report
+            
+            # Save integrated report, and comparison report separately
+            self._write_reports(integrated_report, comparison)
+            
+            self.logger.info(f"Integrated report saved to: {self.integrated_report_file}")
+            self.logger.info(f"Comparison report saved to: {self.comparison_report_file}")
+            
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Error generating integrated report: {e}")
+            return False
+    
+    def _write_reports(self, integrated_report: Dict[str, Any], comparison: Dict[str, Any]) -> None:
+        """
+        Write the integrated and comparison reports.
+        
+        The comparison is also embedded in the integrated report, so it is
+        serialized only once: the integrated report is serialized with a
+        placeholder in its place, and the placeholder is replaced by the
+        comparison's bytes, re-indented to its nesting depth.
+        """
+        comparison_payload = _json_dumps(comparison)
+        placeholder = f"comparison-{uuid.uuid4().hex}"
+        report_payload = _json_dumps({**integrated_report, "comparison_analysis": placeholder})
+        report_payload = report_payload.replace(
+            _json_dumps(placeholder), comparison_payload.replace(b"\n", b"\n  "), 1
+        )
+        
+        for path, payload in ((self.integrated_report_file, report_payload),
+                              (self.comparison_report_file, comparison_payload)):
+            path.write_bytes(payload)
+    
+    def _extract_registry_summary(self, registry: DocumentRegistry) -> Dict[str, Any]:
+        """Extract summary information from registry analysis."""
+        return {
+            "toc_entries": len(registry.toc_entries),
+            "available_files": _sorted_file_lists(registry.available_files),
+            "matched_documents": len(registry.matched_documents),
+            "missing_documents": len(registry.missing_documents),
+            "orphaned_files": len(registry.orphaned_files),
+            "alignment_score": registry._calculate_alignment_score()
+        }
+    
+    def _generate_integrated_recommendations(self, existing_results: Optional[Dict], 
+                                           registry: Optional[DocumentRegistry],
+                                           comparison: Dict) -> List[Dict[str, Any]]:
+        """Generate recommendations based on integrated analysis."""
+        recommendations = []
+        
+        # Assessment-based recommendations
+        assessment = comparison.get("assessment", {})
+        consistency = assessment.get("overall_consistency", "unknown")
+        
+        if consistency == "poor":
+            recommendations.append({
+                "priority": "high",
+                "category": "methodology_review",
+                "title": "Review Analysis Methodology Differences",
+                "description": "Significant differences found between analysis methods",
+                "actions": [
+                    "Compare TOC parsing algorithms",
+                    "Review file detection patterns",
+                    "Verify document matching criteria",
+                    "Standardize analysis approaches"
+                ]
+            })
+        
+        # Registry-specific recommendations
+        if registry:
+            if registry.missing_documents:
+                recommendations.append({
+                    "priority": "high",
+                    "category": "missing_documents",
+                    "title": f"Address {len(registry.missing_documents)} Missing Documents",
+                    "description": "Documents referenced in TOC but not found in file system",
+                    "actions": [
+                        "Verify document naming conventions",
+                        "Check for misfiled documents",
+                        "Confirm if documents are pending creation",
+                        "Update TOC if entries are outdated"
+                    ]
+                })
+            
+            if registry.orphaned_files:
+                recommendations.append({
+                    "priority": "medium",
+                    "category": "orphaned_files",
+                    "title": f"Review {len(registry.orphaned_files)} Orphaned Files",
+                    "description": "Files found without corresponding TOC entries",
+                    "actions": [
+                        "Determine if files should be added to TOC",
+                        "Check for outdated or duplicate versions",
+                        "Verify file naming accuracy",
+                        "Archive or remove obsolete files"
+                    ]
+                })
+        
+        # Integration recommendations
+        recommendations.append({
+            "priority": "medium",
+            "category": "system_integration",
+            "title": "Implement Integrated Analysis Workflow",
+            "description": "Combine strengths of both analysis methods",
+            "actions": [
+                "Use Document Registry for systematic alignment analysis",
+                "Leverage existing analysis for detailed parsing",
+                "Implement regular cross-validation",
+                "Create unified reporting format"
+            ]
+        })
+        
+        return recommendations
+    
+    def _generate_next_steps(self, comparison: Dict) -> List[str]:
+        """Generate next steps based on comparison results."""
+        next_steps = []
+        
+        assessment = comparison.get("assessment", {})
+        confidence = assessment.get("confidence_level", "unknown")
+        
+        if confidence == "high":
+            next_steps.extend([
+                "Proceed with Document Registry system for ongoing analysis",
+                "Implement automated alignment monitoring",
+                "Create regular validation schedules"
+            ])
+        elif confidence == "medium":
+            next_steps.extend([
+                "Investigate specific differences identified",
+                "Run additional validation tests",
+                "Consider hybrid approach using both methods"
+            ])
+        else:
+            next_steps.extend([
+                "Conduct detailed review of analysis methodologies",
+                "Verify data source integrity",
+                "Consider re-implementing analysis with unified approach"
+            ])
+        
+        # Always include these steps
+        next_steps.extend([
+            "Review and act on specific recommendations",
+            "Update documentation with findings",
+            "Plan implementation of identified improvements"
+        ])
+        
+        return next_steps
+    
+    def run_full_integration(self, force: bool = False) -> bool:
+        """
+        Run the complete integration workflow.
+        
+        Args:
+            force: Rerun the analyses even if the inputs are unchanged since the last run
+            
+        Returns:
+            True if integration completed successfully
+        """
+        self.logger.info(f"Starting TOC/Registry integration for {self.state}/{self.city}")
+        
+        # Reuse the previous results when the inputs are unchanged
+        inputs_hash = self._compute_inputs_hash()
+        cached = None if force else self._load_cached_integration(inputs_hash)
+        if cached is not None:
+            self.logger.info("Inputs unchanged since the last run, cache hit")
+            if not (self.integrated_report_file.exists() and self.comparison_report_file.exists()):
+                self._write_reports(cached["integrated_report"], cached["comparison"])
+            self.integrated_report = cached["integrated_report"]
+            print(f"\nInputs unchanged; reusing integrated report: {self.integrated_report_file}")
+            return True
+        
+        # Steps 1 and 2: Run existing analysis and registry analysis
+        existing_results, registry = asyncio.run(self._run_analyses())
+        
+        # Step 3: Compare analyses
+        comparison = self.compare_analyses(existing_results, registry)
+        
+        # Step 4: Generate integrated report
+        success = self.generate_integrated_report(existing_results, registry, comparison)
+        
+        if success:
+            self.logger.info("Integration completed successfully")
+            # Only a run where both analyses produced results is worth reusing;
+            # a failed or timed-out analysis should be retried next run
+            if "assessment" in comparison:
+                self._save_cached_integration(inputs_hash, self.integrated_report, comparison)
+            self._print_integration_summary(existing_results, registry, comparison)
+        else:
+            self.logger.error("Integration failed")
+        
+        return success
+    
+    def _print_integration_summary(self, existing_results: Optional[Dict], 
+                                 registry: Optional[DocumentRegistry], 
+                                 comparison: Dict) -> None:
+        """Print a summary of the integration results."""
+        # Collect the lines and print them in one write
+        lines = []
+        out = lines.append
+        out("\n" + "="*60)
+        out("TOC/REGISTRY INTEGRATION SUMMARY")
+        out("="*60)
+        
+        out(f"\nJurisdiction: {self.state} / {self.city.title()}")
+        
+        out(f"\nAnalysis Results:")
+        if existing_results:
+            out(f"  ✓ Existing analysis completed")
+            out(f"    TOC entries: {len(existing_results.get('toc_entries', []))}")
+        else:
+            out(f"  ✗ Existing analysis failed or unavailable")
+        
+        if registry:
+            out(f"  ✓ Registry analysis completed")
+            out(f"    TOC entries: {len(registry.toc_entries)}")
+            out(f"    Matched documents: {len(registry.matched_documents)}")
+            out(f"    Missing documents: {len(registry.missing_documents)}")
+            out(f"    Orphaned files: {len(registry.orphaned_files)}")
+            # Reuse the score computed for the integrated report
+            registry_summary = self.integrated_report["data_sources"]["registry_analysis"]["results"]
+            out(f"    Alignment score: {registry_summary['alignment_score']:.1f}%")
+        else:
+            out(f"  ✗ Registry analysis failed")
+        
+        assessment = comparison.get("assessment", {})
+        if assessment:
+            out(f"\nComparison Assessment:")
+            out(f"  Overall consistency: {assessment.get('overall_consistency', 'unknown')}")
+            out(f"  Confidence level: {assessment.get('confidence_level', 'unknown')}")
+            
+            differences = assessment.get("significant_differences", [])
+            if differences:
+                out(f"  Significant differences: {len(differences)}")
+                for diff in differences[:3]:  # Show first 3
+                    out(f"    - {diff}")
+                if len(differences) > 3:
+                    out(f"    ... and {len(differences) - 3} more")
+        
+        out(f"\nReports generated:")
+        out(f"  Integrated report: {self.integrated_report_file}")
+        out(f"  Comparison report: {self.comparison_report_file}")
+        print("\n".join(lines))
+
+
+def main():
+    """Main function for command-line usage."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description="TOC/Registry Integration Tool",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s                           # Integrate for Oregon/Gresham
+  %(prog)s --state Oregon --city Portland  # Integrate for Oregon/Portland
+  %(prog)s --verbose                 # Enable verbose logging
+  %(prog)s --force                   # Rerun even if inputs are unchanged
+        """
+    )
+    
+    parser.add_argument(
+        "--state", 
+        default="Oregon", 
+        help="State name (default: Oregon)"
+    )
+    
+    parser.add_argument(
+        "--city", 
+        default="Gresham", 
+        help="City name (default: Gresham)"
+    )
+    
+    parser.add_argument(
+        "--verbose", "-v", 
+        action="store_true", 
+        help="Enable verbose logging"
+    )
+    
+    parser.add_argument(
+        "--force", 
+        action="store_true", 
+        help="Rerun the analyses even if the inputs are unchanged since the last run"
+    )
+    
+    args = parser.parse_args()
+    
+    # Configure logging
+    level = logging.DEBUG if args.verbose else logging.INFO
+    logging.basicConfig(
+        level=level,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    
+    try:
+        # Run integration
+        integrator = TOCRegistryIntegrator(args.state, args.city)
+        success = integrator.run_full_integration(force=args.force)
+        
+        if success:
+            print(f"\n✓ Integration completed successfully!")
+        else:
+            print("Integration failed!")
+            return 1
+        
+        return 0
+        
+    except KeyboardInterrupt:
+        print("\nIntegration interrupted by user.")
+        return 1
+    
+    except Exception as e:
+        print(f"Unexpected error: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Document Content Validation Utility
+Version: 1.0
+Date: May 23, 2025
+
+This script validates that document files contain their expected subsections
+according to the Table of Contents structure.
+
+Usage:
+    python validate_document_content.py [content_dir] [--document-number XX.YY] [--detailed]
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'scripts'))
+
+from scripts.common.hierarchical_document_registry import create_registry_for_location
+from scripts.common.config import get_default_location
+from scripts.common.utils import save_json_file
+
+# Number of subsections listed per document in the detailed printout
+DETAIL_PREVIEW_LIMIT = 10
+
+
+def validate_single_document(registry, document_number: str, detailed: bool = False,
+                             detail_limit: int = None) -> dict:
+    """Validate a single document's content"""
+    result = registry.validate_subsection_content(document_number)
+    
+    if detailed:
+        add_document_details(registry, result, detail_limit)
+    
+    return result
+
+
+def add_document_details(registry, result: dict, detail_limit: int = None) -> None:
+    """Add the document title and per-subsection status to a validation result
+    
+    Only the first detail_limit subsections are listed, or all of them if None.
+    """
+    if 'error' in result:
+        return
+    
+    # Get the hierarchy for more details
+    hierarchy = registry.document_hierarchy.get(result['document_number'])
+    if hierarchy:
+        found = set(result.get('found_list', ()))
+        result['document_details'] = {
+            'title': hierarchy.document_title,
+            'file_path': hierarchy.file_info.filepath if hierarchy.file_info else None,
+            'subsections_detail': [
+                {
+                    'number': sub.number,
+                    'title': sub.title,
+                    'found_in_content': sub.number in found
+                }
+                for sub in hierarchy.subsections[:detail_limit]
+            ]
+        }
+
+
+def validate_all_documents(registry, detailed: bool = False, detail_limit: int = None) -> dict:
+    """Validate all documents with files, in parallel worker processes"""
+    results = registry.validate_documents_with_files()
+    
+    # Calculate summary statistics in the same pass that adds any details
+    successful = 0
+    total_percentage = 0
+    total_expected = 0
+    total_found = 0
+    for result in results:
+        if detailed:
+            add_document_details(registry, result, detail_limit)
+        if 'error' in result:
+            continue
+        successful += 1
+        total_percentage += result.get('validation_percentage', 0)
+        total_expected += result.get('expected_subsections', 0)
+        total_found += result.get('found_subsections', 0)
+    
+    return {
+        'total_documents_with_files': len(results),
+        'successful_validations': successful,
+        'failed_validations': len(results) - successful,
+        'average_validation_percentage': total_percentage / successful if successful else 0,
+        'total_expected_subsections': total_expected,
+        'total_found_subsections': total_found,
+        'validation_results': results
+    }
+
+
+def print_validation_results(results: dict, detailed: bool = False) -> None:
+    """Print validation results"""
+    # Collect the lines and print them in one write
+    lines = []
+    out = lines.append
+    
+    out("\n" + "="*60)
+    out("DOCUMENT CONTENT VALIDATION RESULTS")
+    out("="*60)
+    
+    summary_stats = {
+        'total_documents_with_files': results.get('total_documents_with_files', 0),
+        'successful_validations': results.get('successful_validations', 0),
+        'failed_validations': results.get('failed_validations', 0),
+        'average_validation_percentage': results.get('average_validation_percentage', 0),
+        'total_expected_subsections': results.get('total_expected_subsections', 0),
+        'total_found_subsections': results.get('total_found_subsections', 0)
+    }
+    
+    out("SUMMARY STATISTICS:")
+    out(f"  Total Documents with Files:     {summary_stats['total_documents_with_files']}")
+    out(f"  Successful Validations:         {summary_stats['successful_validations']}")
+    out(f"  Failed Validations:             {summary_stats['failed_validations']}")
+    out(f"  Average Validation Percentage:  {summary_stats['average_validation_percentage']:.1f}%")
+    out(f"  Total Expected Subsections:     {summary_stats['total_expected_subsections']}")
+    out(f"  Total Found Subsections:        {summary_stats['total_found_subsections']}")
+    
+    if summary_stats['total_expected_subsections'] > 0:
+        overall_percentage = (summary_stats['total_found_subsections'] / 
+                            summary_stats['total_expected_subsections']) * 100
+        out(f"  Overall Subsection Coverage:    {overall_percentage:.1f}%")
+    
+    out("")
+    
+    # Show individual results
+    validation_results = results.get('validation_results', [])
+    if isinstance(results, dict) and 'document_number' in results:
+        # Single document result
+        validation_results = [results]
+    
+    if detailed:
+        out("DETAILED VALIDATION RESULTS:")
+        for result in validation_results:
+            if 'error' in result:
+                out(f"  ERROR: {result['error']}")
+                continue
+            
+            doc_num = result.get('document_number', 'Unknown')
+            out(f"  Document {doc_num}:")
+            out(f"    File: {result.get('file_path', 'Unknown')}")
+            out(f"    Expected Subsections: {result.get('expected_subsections', 0)}")
+            out(f"    Found Subsections: {result.get('found_subsections', 0)}")
+            out(f"    Validation Percentage: {result.get('validation_percentage', 0):.1f}%")
+            
+            if 'document_details' in result:
+                details = result['document_details']
+                out(f"    Title: {details.get('title', 'Unknown')}")
+                
+                if 'subsections_detail' in details:
+                    out("    Subsections:")
+                    for sub in details['subsections_detail'][:DETAIL_PREVIEW_LIMIT]:  # Limit output
+                        status = "✓" if sub['found_in_content'] else "✗"
+                        out(f"      {status} {sub['number']}: {sub['title']}")
+                    
+                    # The detail list may itself be truncated, so count from the result
+                    if result.get('expected_subsections', 0) > DETAIL_PREVIEW_LIMIT:
+                        remaining = result['expected_subsections'] - DETAIL_PREVIEW_LIMIT
+                        out(f"      ... and {remaining} more subsections")
+            
+            out("")
+    else:
+        out("VALIDATION RESULTS SUMMARY:")
+        for result in validation_results:
+            if 'error' in result:
+                out(f"  ERROR: {result['error']}")
+                continue
+            
+            doc_num = result.get('document_number', 'Unknown')
+            validation_pct = result.get('validation_percentage', 0)
+            expected = result.get('expected_subsections', 0)
+            found = result.get('found_subsections', 0)
+            
+            status = "✓" if validation_pct > 80 else "⚠" if validation_pct > 50 else "✗"
+            out(f"  {status} {doc_num}: {validation_pct:.1f}% ({found}/{expected} subsections)")
+    
+    print("\n".join(lines))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate document content against TOC structure')
+    
+    # Get default location for fallback
+    default_config = get_default_location()
+    
+    parser.add_argument('content_dir', nargs='?',
+                       default=str(default_config['content_dir']),
+                       help='Directory containing document files')
+    parser.add_argument('--document-number', '-d',
+                       help='Validate specific document number (e.g., 10.04)')
+    parser.add_argument('--detailed', action='store_true',
+                       help='Show detailed subsection validation results')
+    parser.add_argument('--output', '-o',
+                       help='Output file for detailed JSON results')
+    
+    args = parser.parse_args()
+    
+    # Validate content directory
+    if not os.path.exists(args.content_dir):
+        print(f"Error: Content directory does not exist: {args.content_dir}")
+        sys.exit(1)
+    
+    # The JSON output lists every subsection; the printout only needs a preview
+    detail_limit = None if args.output else DETAIL_PREVIEW_LIMIT
+    
+    try:
+        # Create registry
+        print(f"Loading document registry from: {args.content_dir}")
+        registry = create_registry_for_location(args.content_dir)
+        
+        # Perform validation
+        if args.document_number:
+            # Validate single document
+            if args.document_number not in registry.document_hierarchy:
+                print(f"Error: Document {args.document_number} not found in TOC")
+                sys.exit(1)
+            
+            result = validate_single_document(registry, args.document_number, args.detailed, detail_limit)
+            print_validation_results(result, args.detailed)
+            
+            if args.output:
+                save_json_file(result, args.output)
+                print(f"Results saved to: {args.output}")
+        
+        else:
+            # Validate all documents
+            results = validate_all_documents(registry, args.detailed, detail_limit)
+            print_validation_results(results, args.detailed)
+            
+            if args.output:
+                save_json_file(results, args.output)
+                print(f"Results saved to: {args.output}")
+    
+    except Exception as e:
+        print(f"Error during validation: {str(e)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -16,9 +16,16 @@ import json
 import sys
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # Add scripts directory to path
 sys.path.insert(0, '/workspace/RealEstateDevelopmentCode/scripts')
 
@@ -27,6 +34,24 @@ from scripts.common.config import get_default_location
 from scripts.common.utils import save_json_file, load_json_file
 
 
+# Average validation percentage recorded for baseline 1.0
+BASELINE_VALIDATION_PERCENTAGE = 96.3
+
+
+def tally_validations(validation_results):
+    """Count successful and failed validations and average the successful percentages, in one pass"""
+    successful = 0
+    failed = 0
+    total_percentage = 0
+    for result in validation_results:
+        if 'error' in result:
+            failed += 1
+        else:
+            successful += 1
+            total_percentage += result.get('validation_percentage', 0)
+    return successful, failed, total_percentage / max(successful, 1)
+
+
 class ArchiveAndTestRunner:
     """Comprehensive test runner with baseline comparison and archiving"""
     
@@ -36,12 +61,48 @@ class ArchiveAndTestRunner:
         self.baseline_dir = Path("/workspace/RealEstateDevelopmentCode/reports/Oregon/gresham/baseline")
         self.baseline_data = None
         
+        # Result files for this run
+        self.alignment_file = self.test_dir / "alignment_analysis.json"
+        self.validation_file = self.test_dir / "content_validation.json"
+        self.comparison_file = self.test_dir / "baseline_comparison.json"
+        self.report_file = self.test_dir / "test_report.json"
+        self.readme_file = self.test_dir / "README.md"
+        
+        # Validation results from earlier runs, reused for unchanged documents
+        self.validation_cache_file = self.test_dir.parent / "validation_cache.json"
+        
+        # Result files are written on background threads while the next step runs
+        self._io = ThreadPoolExecutor(max_workers=4)
+        self._pending_writes = []
+        
         # Create test directory
         self.test_dir.mkdir(parents=True, exist_ok=True)
         
         print(f"Archive and Test Runner v1.0")
         print(f"Test run: {self.timestamp}")
         print(f"Test directory: {self.test_dir}")
+    
+    def _write_in_background(self, write, *args):
+        """Queue a result file write on the I/O thread pool"""
+        self._pending_writes.append(self._io.submit(write, *args))
+    
+    def wait_for_writes(self):
+        """Wait for all queued result file writes; returns False if any failed"""
+        success = True
+        for future in self._pending_writes:
+            try:
+                future.result()
+            except Exception as e:
+                print(f"ERROR writing results: {e}")
+                success = False
+        self._pending_writes.clear()
+        return success
+    
+    @cached_property
+    def registry(self):
+        """Document registry for the default location, built once per test run"""
+        content_dir = str(get_default_location()['content_dir'])
+        return create_registry_for_location(content_dir)
         
     def load_baseline(self):
         """Load baseline 1.0 data for comparison"""
@@ -52,7 +113,16 @@ class ArchiveAndTestRunner:
             return False
             
         try:
-            self.baseline_data = load_json_file(str(baseline_file))
+            if ijson is not None:
+                # Only the summary metrics are used, so stream-parse just that object
+                with open(baseline_file, 'rb') as f:
+                    # use_float keeps numbers as floats (ijson defaults to Decimal)
+                    summary_metrics = next(ijson.items(f, 'summary_metrics', use_float=True), None)
+                if summary_metrics is None:
+                    raise KeyError('summary_metrics')
+                self.baseline_data = {'summary_metrics': summary_metrics}
+            else:
+                self.baseline_data = load_json_file(str(baseline_file))
             print(f"✓ Loaded baseline 1.0 data")
             print(f"  - Documents: {self.baseline_data['summary_metrics']['total_documents']}")
             print(f"  - Alignment: {self.baseline_data['summary_metrics']['alignment_percentage']}%")
@@ -66,19 +136,13 @@ class ArchiveAndTestRunner:
         print("\n=== Running Alignment Analysis ===")
         
         try:
-            # Get default location
-            default_config = get_default_location()
-            content_dir = str(default_config['content_dir'])
-            
-            # Create registry
-            registry = create_registry_for_location(content_dir)
+            registry = self.registry
             
             # Generate alignment report
             report = registry.generate_alignment_report()
             
             # Save results
-            results_file = self.test_dir / "alignment_analysis.json"
-            save_json_file(report, str(results_file))
+            self._write_in_background(save_json_file, report, self.alignment_file)
             
             print(f"✓ Alignment analysis complete")
             print(f"  - Total documents: {report['metrics']['total_documents']}")
@@ -96,26 +160,21 @@ class ArchiveAndTestRunner:
         print("\n=== Running Content Validation ===")
         
         try:
-            # Get default location  
-            default_config = get_default_location()
-            content_dir = str(default_config['content_dir'])
+            registry = self.registry
             
-            # Create registry
-            registry = create_registry_for_location(content_dir)
-            
-            # Run validation for all documents with files
-            validation_results = []
-            for doc_num, hierarchy in registry.document_hierarchy.items():
-                if hierarchy.has_file:
-                    validation = registry.validate_subsection_content(doc_num)
-                    validation_results.append(validation)
+            # Run validation for all documents with files, in parallel worker
+            # processes, reusing earlier results for unchanged documents
+            try:
+                validation_cache = load_json_file(self.validation_cache_file)
+            except FileNotFoundError:
+                validation_cache = {}
+            validation_results = registry.validate_documents_with_files(cache=validation_cache)
+            self._write_in_background(save_json_file, validation_cache, self.validation_cache_file)
             
             # Save results
-            results_file = self.test_dir / "content_validation.json"
-            save_json_file(validation_results, str(results_file))
+            self._write_in_background(save_json_file, validation_results, self.validation_file)
             
-            successful = sum(1 for result in validation_results if 'error' not in result)
-            avg_percentage = sum(result.get('validation_percentage', 0) for result in validation_results if 'error' not in result) / max(successful, 1)
+            successful, _, avg_percentage = tally_validations(validation_results)
             
             print(f"✓ Content validation complete")
             print(f"  - Total validations: {len(validation_results)}")
@@ -137,13 +196,14 @@ class ArchiveAndTestRunner:
             return None
         
         # Calculate current metrics
+        successful, _, avg_percentage = tally_validations(current_validation)
         current_metrics = {
             'total_documents': current_alignment['metrics']['total_documents'],
             'documents_with_files': current_alignment['metrics']['documents_with_files'],
             'alignment_percentage': current_alignment['metrics']['alignment_percentage'],
             'total_validations': len(current_validation),
-            'successful_validations': sum(1 for v in current_validation if 'error' not in v),
-            'avg_validation_percentage': sum(v.get('validation_percentage', 0) for v in current_validation if 'error' not in v) / max(sum(1 for v in current_validation if 'error' not in v), 1)
+            'successful_validations': successful,
+            'avg_validation_percentage': avg_percentage
         }
         
         # Get baseline metrics
@@ -159,7 +219,7 @@ class ArchiveAndTestRunner:
                 'total_documents': current_metrics['total_documents'] - baseline_metrics['total_documents'],
                 'documents_with_files': current_metrics['documents_with_files'] - baseline_metrics['documents_with_files'],
                 'alignment_percentage': round(current_metrics['alignment_percentage'] - baseline_metrics['alignment_percentage'], 1),
-                'avg_validation_percentage': round(current_metrics['avg_validation_percentage'] - 96.3, 1)  # Baseline was 96.3%
+                'avg_validation_percentage': round(current_metrics['avg_validation_percentage'] - BASELINE_VALIDATION_PERCENTAGE, 1)
             },
             'status': 'PASS'  # Will be updated based on thresholds
         }
@@ -173,8 +233,7 @@ class ArchiveAndTestRunner:
             comparison['status'] = 'WARN'
         
         # Save comparison
-        comparison_file = self.test_dir / "baseline_comparison.json"
-        save_json_file(comparison, str(comparison_file))
+        self._write_in_background(save_json_file, comparison, self.comparison_file)
         
         # Print results
         print(f"Status: {comparison['status']}")
@@ -188,6 +247,9 @@ class ArchiveAndTestRunner:
         """Generate comprehensive test report"""
         print("\n=== Generating Test Report ===")
         
+        if validation_data:
+            successful, failed, _ = tally_validations(validation_data)
+        
         report = {
             'test_run': {
                 'timestamp': self.timestamp,
@@ -197,8 +259,8 @@ class ArchiveAndTestRunner:
             'alignment_summary': alignment_data['metrics'] if alignment_data else None,
             'validation_summary': {
                 'total_validations': len(validation_data) if validation_data else 0,
-                'successful_validations': sum(1 for v in validation_data if 'error' not in v) if validation_data else 0,
-                'failed_validations': sum(1 for v in validation_data if 'error' in v) if validation_data else 0
+                'successful_validations': successful,
+                'failed_validations': failed
             } if validation_data else None,
             'baseline_comparison': comparison_data,
             'test_files': {
@@ -209,8 +271,7 @@ class ArchiveAndTestRunner:
         }
         
         # Save comprehensive report
-        report_file = self.test_dir / "test_report.json"
-        save_json_file(report, str(report_file))
+        self._write_in_background(save_json_file, report, self.report_file)
         
         # Generate markdown summary
         md_content = f"""# Test Run Report - {self.timestamp}
@@ -232,7 +293,7 @@ class ArchiveAndTestRunner:
 
 ### Content Validation  
 - **Current**: {comparison_data['current_metrics']['avg_validation_percentage']:.1f}%
-- **Baseline**: 96.3%
+- **Baseline**: {BASELINE_VALIDATION_PERCENTAGE}%
 - **Difference**: {comparison_data['differences']['avg_validation_percentage']:+.1f}%
 
 ### Documents
@@ -252,12 +313,10 @@ class ArchiveAndTestRunner:
 `{self.test_dir}`
 """
         
-        md_file = self.test_dir / "README.md"
-        with open(md_file, 'w', encoding='utf-8') as f:
-            f.write(md_content)
+        self._write_in_background(self.readme_file.write_text, md_content, 'utf-8')
         
-        print(f"✓ Test report generated: {report_file}")
-        print(f"✓ Test summary: {md_file}")
+        print(f"✓ Test report generated: {self.report_file}")
+        print(f"✓ Test summary: {self.readme_file}")
         
         return report
     
@@ -271,15 +330,21 @@ class ArchiveAndTestRunner:
             print("No previous test runs to archive")
             return
         
-        # Get all test run directories
-        test_dirs = [d for d in test_runs_dir.iterdir() if d.is_dir() and d.name != self.timestamp]
-        test_dirs.sort(key=lambda x: x.name, reverse=True)
-        
-        # Keep only the latest N runs
-        if len(test_dirs) > keep_latest:
-            for old_dir in test_dirs[keep_latest:]:
+        # Get all test run directories, newest first. Run directories are named
+        # by timestamp, so name order is run order, and scandir's entries
+        # answer is_dir without a stat call per directory.
+        with os.scandir(test_runs_dir) as entries:
+            test_dirs = [entry for entry in entries
+                         if entry.is_dir(follow_symlinks=False) and entry.name != self.timestamp]
+        test_dirs.sort(key=lambda entry: entry.name, reverse=True)
+        
+        # Keep only the latest N runs, removing the old ones concurrently
+        old_dirs = test_dirs[keep_latest:]
+        if old_dirs:
+            for old_dir in old_dirs:
                 print(f"Archiving old test run: {old_dir.name}")
-                shutil.rmtree(old_dir)
+            with ThreadPoolExecutor(max_workers=min(8, len(old_dirs))) as executor:
+                list(executor.map(shutil.rmtree, old_dirs))
         
         print(f"✓ Archived old runs, kept {min(len(test_dirs), keep_latest)} recent runs")
     
@@ -306,13 +371,17 @@ class ArchiveAndTestRunner:
         # Archive old runs
         self.archive_previous_runs()
         
+        # Make sure every result file is on disk before reporting
+        writes_succeeded = self.wait_for_writes()
+        self._io.shutdown()
+        
         # Final summary
         print("\n" + "="*60)
         print(f"TEST COMPLETE - Status: {test_report['test_run']['status']}")
         print(f"Results saved to: {self.test_dir}")
         print("="*60)
         
-        return test_report['test_run']['status'] in ['PASS', 'WARN']
+        return writes_succeeded and test_report['test_run']['status'] in ['PASS', 'WARN']
 
 
 def main():
@@ -9,13 +9,21 @@ to ensure maximum accuracy for municipal development codes, especially tables.
 Updates to work with the multi-jurisdiction MCP server structure.
 """
 
+import hashlib
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import sys
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -23,6 +31,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger("AccurateMunicipalRAG")
 
+# Processor owned by the current worker process, set by _init_worker
+_PROCESSOR = None
+
+# Read size for hashing PDFs
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Default cap on worker processes; each may run hi_res Unstructured and a
+# Tabula JVM, so one per core can exhaust memory. Override with RAG_NUM_WORKERS.
+DEFAULT_MAX_WORKERS = 4
+
+# Part of every cache key; bump it when extraction changes in a way that
+# makes previously cached results wrong
+CACHE_VERSION = 1
+
 class AccurateMunicipalRAG:
     """High-accuracy RAG preparation optimized for municipal codes with tables"""
     
@@ -31,6 +53,9 @@ class AccurateMunicipalRAG:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
+        # PDF results keyed by the PDF's content, path and extraction settings
+        self.cache_dir = self.output_dir / ".cache"
+        
         # Check for required packages
         self._check_dependencies()
         
@@ -38,11 +63,14 @@ class AccurateMunicipalRAG:
         from langchain.text_splitter import RecursiveCharacterTextSplitter
         
         # Configure for legal document accuracy
+        self.splitter_settings = {
+            "chunk_size": 800,         # Smaller for table accuracy
+            "chunk_overlap": 150,      # More overlap for context
+            "separators": ["\n\n", "\n", ".", " "]
+        }
         self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=800,            # Smaller for table accuracy
-            chunk_overlap=150,         # More overlap for context
             length_function=len,
-            separators=["\n\n", "\n", ".", " "]
+            **self.splitter_settings
         )
     
     def _check_dependencies(self):
@@ -91,6 +119,13 @@ class AccurateMunicipalRAG:
             logger.warning(f"PDF not found at {pdf_path}")
             return []
         
+        # Reuse the results of an earlier run on the same PDF
+        cache_file = self.cache_dir / f"{self._cache_key(pdf_file)}.jsonl"
+        cached = self._load_cached_results(cache_file)
+        if cached is not None:
+            logger.info(f"Using cached results for {pdf_file.name}")
+            return cached
+        
         results = []
         
         # Step 1: Extract with Unstructured (best for structure)
@@ -111,12 +146,13 @@ class AccurateMunicipalRAG:
             text_elements = []
             table_elements = []
             
+            # One attribute lookup per element; elements without a category are skipped
             for element in elements:
-                if hasattr(element, 'category'):
-                    if element.category == "Table":
-                        table_elements.append(element)
-                    else:
-                        text_elements.append(element)
+                category = getattr(element, 'category', None)
+                if category == "Table":
+                    table_elements.append(element)
+                elif category is not None:
+                    text_elements.append(element)
             
             # Step 3: Process tables with specialized extraction
             if table_elements:
@@ -134,9 +170,48 @@ class AccurateMunicipalRAG:
             # Fallback to simpler parsing options
             logger.info("Falling back to simpler extraction...")
             results.extend(self._extract_with_fallback(pdf_path))
+            # The Unstructured failure may be transient, so try it again next run
+            return results
         
+        # An empty result usually means extraction failed, so try again next run
+        if results:
+            self._save_cached_results(cache_file, results)
         return results
     
+    def _cache_key(self, pdf_file: Path) -> str:
+        """Get the cache key for a PDF's results
+        
+        Covers the PDF's content, and its path since the results' source and
+        document_id come from it, along with the settings that shape the results.
+        """
+        key = [CACHE_VERSION, str(pdf_file.resolve()), _file_sha256(pdf_file),
+               self.splitter_settings, self.has_camelot]
+        return hashlib.sha256(json.dumps(key).encode('utf-8')).hexdigest()
+    
+    def _load_cached_results(self, cache_file: Path) -> Optional[List[Dict]]:
+        """Load cached PDF results, or None if there are none"""
+        try:
+            with open(cache_file, 'r') as f:
+                return [json.loads(line) for line in f]
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache file {cache_file}: {e}")
+            return None
+    
+    def _save_cached_results(self, cache_file: Path, results: List[Dict]):
+        """Cache PDF results, writing to a temporary file so a partial write is never read"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, 'wb') as f:
+                for result in results:
+                    f.write(_dumps(result, default=str))
+                    f.write(b'\n')
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            logger.warning(f"Could not cache results in {cache_file}: {e}")
+    
     def _extract_tables_accurately(self, pdf_path: str, table_elements: List) -> List[Dict]:
         """Extract tables with multiple methods for accuracy"""
         
@@ -144,11 +219,20 @@ class AccurateMunicipalRAG:
         
         table_results = []
         
+        # Only scan the pages Unstructured found tables on, or every page if
+        # it did not record page numbers
+        table_pages = sorted({
+            element.metadata.page_number for element in table_elements
+            if getattr(getattr(element, 'metadata', None), 'page_number', None)
+        })
+        camelot_pages = ','.join(map(str, table_pages)) if table_pages else 'all'
+        tabula_pages = table_pages or 'all'
+        
         # Method 1: Camelot (if available - best for lattice tables)
         if self.has_camelot:
             try:
                 import camelot
-                camelot_tables = camelot.read_pdf(pdf_path, pages='all', flavor='lattice')
+                camelot_tables = camelot.read_pdf(pdf_path, pages=camelot_pages, flavor='lattice')
                 logger.info(f"Camelot extracted {len(camelot_tables)} tables")
                 
                 for i, table in enumerate(camelot_tables):
@@ -158,7 +242,7 @@ class AccurateMunicipalRAG:
                             "method": "camelot_lattice",
                             "accuracy": table.accuracy,
                             "content": table.df.to_markdown(index=False),
-                            "raw_data": table.df.to_dict('records'),
+                            "raw_data": self._dataframe_raw_data(table.df),
                             "metadata": {
                                 "table_id": f"camelot_{i}",
                                 "page": table.page,
@@ -173,7 +257,7 @@ class AccurateMunicipalRAG:
         
         # Method 2: Tabula (backup for stream tables)
         try:
-            tabula_tables = tabula.read_pdf(pdf_path, pages='all', multiple_tables=True)
+            tabula_tables = tabula.read_pdf(pdf_path, pages=tabula_pages, multiple_tables=True)
             logger.info(f"Tabula extracted {len(tabula_tables)} tables")
             
             for i, df in enumerate(tabula_tables):
@@ -182,7 +266,7 @@ class AccurateMunicipalRAG:
                         "type": "table",
                         "method": "tabula",
                         "content": df.to_markdown(index=False),
-                        "raw_data": df.to_dict('records'),
+                        "raw_data": self._dataframe_raw_data(df),
                         "metadata": {
                             "table_id": f"tabula_{i}",
                             "shape": df.shape,
@@ -253,7 +337,7 @@ class AccurateMunicipalRAG:
                         "type": "table",
                         "method": "tabula_fallback",
                         "content": df.to_markdown(index=False),
-                        "raw_data": df.to_dict('records'),
+                        "raw_data": self._dataframe_raw_data(df),
                         "metadata": {
                             "table_id": f"fallback_{i}",
                             "source": pdf_path,
@@ -265,12 +349,7 @@ class AccurateMunicipalRAG:
         
         # Still need to extract text even if table extraction failed
         try:
-            import pdfplumber
-            
-            with pdfplumber.open(pdf_path) as pdf:
-                full_text = ""
-                for page in pdf.pages:
-                    full_text += page.extract_text() + "\n\n"
+            full_text = self._extract_fallback_text(pdf_path)
             
             # Create document
             doc = Document(
@@ -297,14 +376,34 @@ class AccurateMunicipalRAG:
         
         return results
     
-    def prepare_from_json_content(self, jurisdiction: str = None) -> Dict[str, Any]:
+    def _extract_fallback_text(self, pdf_path: str) -> str:
+        """Extract plain text from every page, with PyMuPDF if available (much faster) or pdfplumber"""
+        try:
+            import fitz
+        except ImportError:
+            logger.info("PyMuPDF not available, using pdfplumber for fallback text")
+        else:
+            with fitz.open(pdf_path) as pdf:
+                return "".join(page.get_text() + "\n\n" for page in pdf)
+        
+        import pdfplumber
+        
+        with pdfplumber.open(pdf_path) as pdf:
+            full_text = ""
+            for page in pdf.pages:
+                full_text += page.extract_text() + "\n\n"
+        return full_text
+    
+    def prepare_from_json_content(self, jurisdiction: str = None,
+                                  max_workers: Optional[int] = None) -> Dict[str, Any]:
         """Process already-extracted JSON content, looking for corresponding PDFs
         
         Args:
             jurisdiction: Optional jurisdiction in format "State/locality", defaults to detecting from paths
+            max_workers: Number of worker processes, defaults to the RAG_NUM_WORKERS
+                environment variable, or the CPU count capped at DEFAULT_MAX_WORKERS
         """
         
-        all_results = []
         stats = {"processed": 0, "tables_found": 0, "text_chunks": 0, "errors": 0}
         
         # Determine jurisdiction from paths if not provided
@@ -328,58 +427,97 @@ class AccurateMunicipalRAG:
         if not pdf_dir.exists():
             logger.warning(f"PDF directory not found at {pdf_dir}")
         
-        for json_file in self.source_dir.glob("*.json"):
-            try:
-                # Prioritize JSON content (much more accurate than PDF parsing)
-                logger.info(f"Processing {json_file.name} using structured JSON content...")
-                json_results = self._process_json_primary(json_file, jurisdiction)
-                all_results.extend(json_results)
-                
-                # Count results
-                table_count = len([r for r in json_results if r['type'] == 'table'])
-                text_count = len([r for r in json_results if r['type'] == 'text'])
-                
-                stats["tables_found"] += table_count
-                stats["text_chunks"] += text_count
-                
-                # Optional: If PDF exists and we want additional table extraction
-                pdf_name = json_file.stem + ".pdf"
-                pdf_path = pdf_dir / pdf_name
-                
-                if pdf_path.exists() and table_count == 0:
-                    # Only use PDF for table extraction if JSON had no tables
-                    logger.info(f"Supplementing with PDF table extraction for {json_file.name}...")
-                    try:
-                        pdf_results = self.process_document_with_tables(str(pdf_path))
-                        pdf_tables = [r for r in pdf_results if r['type'] == 'table']
-                        
-                        if pdf_tables:
-                            # Update metadata for PDF tables
-                            for table in pdf_tables:
-                                table["metadata"]["jurisdiction"] = jurisdiction
-                                table["metadata"]["source_supplement"] = "pdf_tables"
-                            
-                            all_results.extend(pdf_tables)
-                            stats["tables_found"] += len(pdf_tables)
-                            logger.info(f"Added {len(pdf_tables)} tables from PDF")
-                        else:
-                            logger.info(f"No additional tables found in PDF for {json_file.name}")
-                    except Exception as e:
-                        logger.warning(f"PDF table extraction failed for {json_file.name}: {e}")
-                        logger.info("Continuing with JSON-only processing...")
-                elif pdf_path.exists():
-                    logger.debug(f"Skipping PDF supplement for {json_file.name} (JSON already has {table_count} tables)")
-                
-                stats["processed"] += 1
-                
-            except Exception as e:
-                logger.error(f"Error processing {json_file}: {e}")
-                stats["errors"] += 1
+        # Process files in parallel worker processes, writing results in file order.
+        # Results are not buffered for the whole run, but a file that finishes
+        # early is held until every earlier file has been written.
+        json_files = sorted(self.source_dir.glob("*.json"))
+        workers = _get_max_workers(len(json_files), max_workers)
+        with _ResultWriter(self.output_dir) as writer:
+            if workers <= 1:
+                outcomes = (self._process_source_file(json_file, pdf_dir, jurisdiction)
+                            for json_file in json_files)
+                self._write_outcomes(outcomes, writer, stats)
+            else:
+                logger.info(f"Processing {len(json_files)} files with {workers} worker processes")
+                # The processor holds the text splitter, so each worker builds its own at startup
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                         initargs=(str(self.source_dir), str(self.output_dir))) as executor:
+                    outcomes = executor.map(_process_source_file_in_worker, json_files,
+                                            repeat(pdf_dir), repeat(jurisdiction))
+                    self._write_outcomes(outcomes, writer, stats)
         
-        # Save results
-        self._save_accurate_results(all_results, stats)
+        # Save stats
+        self._save_accurate_results(stats)
         return stats
     
+    def _process_source_file(self, json_file: Path, pdf_dir: Path,
+                             jurisdiction: str) -> Tuple[List[Dict], Dict[str, int]]:
+        """Process one JSON content file, adding tables from its PDF if the JSON has none
+        
+        Returns the file's results and its counts toward the run statistics.
+        """
+        
+        results = []
+        stats = {"processed": 0, "tables_found": 0, "text_chunks": 0, "errors": 0}
+        
+        try:
+            # Prioritize JSON content (much more accurate than PDF parsing)
+            logger.info(f"Processing {json_file.name} using structured JSON content...")
+            json_results = self._process_json_primary(json_file, jurisdiction)
+            results.extend(json_results)
+            
+            # Count results
+            table_count = len([r for r in json_results if r['type'] == 'table'])
+            text_count = len([r for r in json_results if r['type'] == 'text'])
+            
+            stats["tables_found"] += table_count
+            stats["text_chunks"] += text_count
+            
+            # Optional: If PDF exists and we want additional table extraction
+            pdf_name = json_file.stem + ".pdf"
+            pdf_path = pdf_dir / pdf_name
+            
+            if pdf_path.exists() and table_count == 0:
+                # Only use PDF for table extraction if JSON had no tables
+                logger.info(f"Supplementing with PDF table extraction for {json_file.name}...")
+                try:
+                    pdf_results = self.process_document_with_tables(str(pdf_path))
+                    pdf_tables = [r for r in pdf_results if r['type'] == 'table']
+                    
+                    if pdf_tables:
+                        # Update metadata for PDF tables
+                        for table in pdf_tables:
+                            table["metadata"]["jurisdiction"] = jurisdiction
+                            table["metadata"]["source_supplement"] = "pdf_tables"
+                        
+                        results.extend(pdf_tables)
+                        stats["tables_found"] += len(pdf_tables)
+                        logger.info(f"Added {len(pdf_tables)} tables from PDF")
+                    else:
+                        logger.info(f"No additional tables found in PDF for {json_file.name}")
+                except Exception as e:
+                    logger.warning(f"PDF table extraction failed for {json_file.name}: {e}")
+                    logger.info("Continuing with JSON-only processing...")
+            elif pdf_path.exists():
+                logger.debug(f"Skipping PDF supplement for {json_file.name} (JSON already has {table_count} tables)")
+            
+            stats["processed"] += 1
+            
+        except Exception as e:
+            logger.error(f"Error processing {json_file}: {e}")
+            stats["errors"] += 1
+        
+        return results, stats
+    
+    @staticmethod
+    def _write_outcomes(outcomes, writer: "_ResultWriter", stats: Dict[str, int]) -> None:
+        """Write each file's results and add its counts to the run totals"""
+        for results, file_stats in outcomes:
+            for result in results:
+                writer.write(result)
+            for key, value in file_stats.items():
+                stats[key] += value
+    
     def _process_json_primary(self, json_file: Path, jurisdiction: str) -> List[Dict]:
         """Process JSON content as primary source (more accurate than PDFs)
         
@@ -393,15 +531,25 @@ class AccurateMunicipalRAG:
         with open(json_file, 'r') as f:
             doc_data = json.load(f)
         
-        results = []
+        # Results for each page, and the page text to chunk in one batch afterwards
+        page_results = []
+        page_docs = []
         
         # Extract structured content from JSON (much richer than PDF)
+        # Every table and chunk repeats these, so build them once and intern them;
+        # they then stay shared through chunking and when pickled back from a worker
+        source = sys.intern(str(json_file))
         document_title = doc_data.get('metadata', {}).get('title', json_file.stem)
-        document_id = json_file.stem.replace('dc-section-', '')
+        if isinstance(document_title, str):
+            document_title = sys.intern(document_title)
+        document_id = sys.intern(json_file.stem.replace('dc-section-', ''))
+        jurisdiction = sys.intern(jurisdiction)
         
         # Process each page with its structured content
         for page_num, page in enumerate(doc_data.get('pages', [])):
             page_text = page.get('text', '')
+            results = []
+            page_results.append(results)
             
             # Extract tables from JSON structured tables array
             if 'tables' in page and page['tables']:
@@ -412,7 +560,7 @@ class AccurateMunicipalRAG:
                         "content": self._format_json_table(table),
                         "raw_data": table,
                         "metadata": {
-                            "source": str(json_file),
+                            "source": source,
                             "document_id": document_id,
                             "document_title": document_title,
                             "jurisdiction": jurisdiction,
@@ -431,7 +579,7 @@ class AccurateMunicipalRAG:
                     "content": table_content,
                     "raw_data": {"text_table": table_content},
                     "metadata": {
-                        "source": str(json_file),
+                        "source": source,
                         "document_id": document_id,
                         "document_title": document_title,
                         "jurisdiction": jurisdiction,
@@ -444,29 +592,27 @@ class AccurateMunicipalRAG:
             # Process text content if substantial
             if page_text.strip() and len(page_text.strip()) > 50:
                 # Create document for this page
-                doc = Document(
+                page_docs.append(Document(
                     page_content=page_text,
                     metadata={
-                        "source": str(json_file),
+                        "source": source,
                         "document_id": document_id,
                         "document_title": document_title,
                         "jurisdiction": jurisdiction,
                         "page": page_num + 1,
                         "content_type": "structured_text"
                     }
-                )
-                
-                # Chunk the page content
-                chunks = self.text_splitter.split_documents([doc])
-                
-                for chunk in chunks:
-                    results.append({
-                        "type": "text",
-                        "content": chunk.page_content,
-                        "metadata": chunk.metadata
-                    })
+                ))
         
-        return results
+        # Chunk every page in one call, then put each chunk after its page's tables
+        for chunk in self.text_splitter.split_documents(page_docs):
+            page_results[chunk.metadata["page"] - 1].append({
+                "type": "text",
+                "content": chunk.page_content,
+                "metadata": chunk.metadata
+            })
+        
+        return [result for results in page_results for result in results]
     
     def _extract_tables_from_text(self, text: str) -> List[str]:
         """Extract table-like structures from text content"""
@@ -546,6 +692,14 @@ class AccurateMunicipalRAG:
         
         return md_table if md_table.count('|') > 6 else table_text
     
+    @staticmethod
+    def _dataframe_raw_data(df) -> Dict[str, List]:
+        """Get an extracted table's cells as a column list and row lists
+        
+        Built with NumPy instead of to_dict('records'), which makes a dict per row.
+        """
+        return {"columns": df.columns.tolist(), "rows": df.to_numpy().tolist()}
+    
     def _format_json_table(self, table_data: Dict) -> str:
         """Format JSON table data into readable markdown"""
         
@@ -585,26 +739,12 @@ class AccurateMunicipalRAG:
         
         return str(table_data)
     
-    def _save_accurate_results(self, results: List[Dict], stats: Dict):
-        """Save results optimized for table and text accuracy"""
-        
-        # Save all chunks
-        chunks_file = self.output_dir / "accurate_chunks.jsonl"
-        with open(chunks_file, 'w') as f:
-            for result in results:
-                f.write(json.dumps(result) + '\n')
-        
-        # Save tables separately for reference
-        tables = [r for r in results if r['type'] == 'table']
-        if tables:
-            tables_file = self.output_dir / "extracted_tables.json"
-            with open(tables_file, 'w') as f:
-                json.dump(tables, f, indent=2)
+    def _save_accurate_results(self, stats: Dict):
+        """Save run statistics; the chunks and tables are written by _ResultWriter"""
         
         # Save stats
         stats_file = self.output_dir / "accuracy_stats.json"
-        with open(stats_file, 'w') as f:
-            json.dump(stats, f, indent=2)
+        stats_file.write_bytes(_dumps(stats, indent=True))
         
         logger.info(f"\n📊 Processing Complete:")
         logger.info(f"   - Documents: {stats['processed']}")
@@ -613,6 +753,87 @@ class AccurateMunicipalRAG:
         logger.info(f"   - Errors: {stats['errors']}")
         logger.info(f"   - Output: {self.output_dir}")
 
+class _ResultWriter:
+    """Writes results to accurate_chunks.jsonl as they are produced
+    
+    Tables are also written to extracted_tables.json as a JSON array, which is
+    only created once the first table arrives.
+    """
+    
+    def __init__(self, output_dir: Path):
+        self.chunks_file = open(output_dir / "accurate_chunks.jsonl", 'wb')
+        self.tables_path = output_dir / "extracted_tables.json"
+        self.tables_file = None
+    
+    def write(self, result: Dict) -> None:
+        # Unstructured's element metadata is not JSON serializable, so it is
+        # written as a string, as it is in the PDF result cache
+        self.chunks_file.write(_dumps(result, default=str))
+        self.chunks_file.write(b'\n')
+        if result['type'] == 'table':
+            self._write_table(result)
+    
+    def _write_table(self, table: Dict) -> None:
+        # Same layout as json.dump(tables, f, indent=2); strings are escaped,
+        # so every newline in the encoded table starts a new line of JSON
+        if self.tables_file is None:
+            self.tables_file = open(self.tables_path, 'wb')
+            self.tables_file.write(b'[\n')
+        else:
+            self.tables_file.write(b',\n')
+        self.tables_file.write(b'  ' + _dumps(table, indent=True, default=str).replace(b'\n', b'\n  '))
+    
+    def close(self) -> None:
+        self.chunks_file.close()
+        if self.tables_file is not None:
+            self.tables_file.write(b'\n]')
+            self.tables_file.close()
+    
+    def __enter__(self) -> "_ResultWriter":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+def _dumps(obj: Any, indent: bool = False, default=None) -> bytes:
+    """Serialize to JSON bytes, using orjson when available"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+    return json.dumps(obj, indent=2 if indent else None, default=default).encode('utf-8')
+
+def _file_sha256(path: Path) -> str:
+    """Get the SHA-256 hex digest of a file's content"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _get_max_workers(num_files: int, requested: Optional[int] = None) -> int:
+    """Get the number of worker processes to use for a batch of files
+    
+    Uses the requested count, else the RAG_NUM_WORKERS environment variable,
+    else the CPU count capped at DEFAULT_MAX_WORKERS.
+    """
+    workers = requested or os.environ.get('RAG_NUM_WORKERS')
+    if workers:
+        workers = int(workers)
+    else:
+        workers = min(os.cpu_count() or 1, DEFAULT_MAX_WORKERS)
+    return max(1, min(num_files, workers))
+
+def _init_worker(source_dir: str, output_dir: str) -> None:
+    """Build the processor once per worker process and reuse it for every file"""
+    global _PROCESSOR
+    _PROCESSOR = AccurateMunicipalRAG(source_dir, output_dir)
+
+def _process_source_file_in_worker(json_file: Path, pdf_dir: Path, jurisdiction: str) -> Tuple[List[Dict], Dict[str, int]]:
+    """Process one JSON content file in a worker process"""
+    return _PROCESSOR._process_source_file(json_file, pdf_dir, jurisdiction)
+
 if __name__ == "__main__":
     # Process with high accuracy for tables
     processor = AccurateMunicipalRAG(
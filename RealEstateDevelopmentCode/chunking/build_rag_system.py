@@ -77,7 +77,7 @@ def install_dependencies():
         logger.error(f"Failed to install dependencies: {e}")
         return False
 
-def build_complete_rag_system(source_dir=None, jurisdiction=None):
+def build_complete_rag_system(source_dir=None, jurisdiction=None, max_workers=None):
     """Build the complete RAG system"""
     
     # Skip dependency check for now since we have confirmed packages are available
@@ -125,7 +125,7 @@ def build_complete_rag_system(source_dir=None, jurisdiction=None):
         output_dir=str(rag_data_dir)
     )
     
-    stats = preparator.prepare_from_json_content(jurisdiction=jurisdiction)
+    stats = preparator.prepare_from_json_content(jurisdiction=jurisdiction, max_workers=max_workers)
     
     if stats['errors'] > 0:
         logger.warning(f"⚠️  Warning: {stats['errors']} errors occurred during preparation")
@@ -189,12 +189,15 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Build RAG data for municipal code')
     parser.add_argument('--source', help='Source directory with JSON documents')
     parser.add_argument('--jurisdiction', help='Jurisdiction code (state/locality)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Number of worker processes (default: RAG_NUM_WORKERS, or CPU count up to 4)')
     
     args = parser.parse_args()
     
     success = build_complete_rag_system(
         source_dir=args.source,
-        jurisdiction=args.jurisdiction
+        jurisdiction=args.jurisdiction,
+        max_workers=args.workers
     )
     
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -37,7 +37,10 @@ PATTERNS = {
     'subsection': r'^\d+\.\d{4}$',      # XX.YYYY format
     'section_header': r'SECTION\s+(\d+\.\d+)\s+([A-Z\s]+)',
     'toc_subsection': r'(\d+\.\d{4})\s+([^.\n]+?)(?=\s*\n|\s+\d+\.\d{4})',
-    'filename_number': r'(\d+\.\d+)'
+    'filename_number': r'(\d+\.\d+)',
+    # Every XX.YYYY number in a text, including ones that overlap or are
+    # embedded in longer numbers, matching plain substring search
+    'subsection_in_text': r'(?=(\d+\.\d{4}))'
 }
 
 # Default locations for testing/demo
@@ -71,6 +74,18 @@ def get_default_location() -> Dict[str, Any]:
     return DEFAULT_LOCATIONS['gresham'].copy()
 
 
+def get_validation_workers() -> int:
+    """Get the number of worker processes for content validation.
+    
+    Set with the VALIDATE_NUM_THREADS environment variable; defaults to one
+    less than the CPU count, leaving a core for the parent process.
+    """
+    workers = os.environ.get('VALIDATE_NUM_THREADS')
+    if workers:
+        return max(1, int(workers))
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
 def ensure_directories_exist(state: str, city: str) -> None:
     """Ensure all necessary directories exist for a location"""
     dirs_to_create = [
@@ -12,15 +12,17 @@ Key insight: Municipal codes have hierarchical structure where subsections
 exist within parent document files, not as separate files.
 """
 
-import json
+import hashlib
+import mmap
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Optional
 from dataclasses import dataclass, field
 from collections import defaultdict
 
-from .config import PATTERNS, DEFAULT_FILES
+from .config import PATTERNS, DEFAULT_FILES, get_validation_workers
 from .utils import (
     load_json_file, save_json_file, extract_number_from_filename,
     is_document_level, is_subsection, get_parent_document,
@@ -28,6 +30,9 @@ from .utils import (
     calculate_percentage
 )
 
+# Compiled as a bytes pattern to scan memory-mapped document files directly
+SUBSECTION_IN_TEXT_RE = re.compile(PATTERNS['subsection_in_text'].encode('ascii'))
+
 
 @dataclass
 class TOCEntry:
@@ -255,16 +260,20 @@ class HierarchicalDocumentRegistry:
     def calculate_alignment_metrics(self) -> AlignmentMetrics:
         """Calculate alignment metrics"""
         total_documents = len(self.document_hierarchy)
-        documents_with_files = sum(1 for h in self.document_hierarchy.values() if h.has_file)
-        documents_without_files = total_documents - documents_with_files
-        total_subsections = sum(h.subsection_count for h in self.document_hierarchy.values())
         
-        # Count orphaned files (files without matching documents)
+        # Count files, subsections and matched files in a single pass
+        documents_with_files = 0
+        total_subsections = 0
         matched_files = set()
         for hierarchy in self.document_hierarchy.values():
-            if hierarchy.file_info:
+            total_subsections += hierarchy.subsection_count
+            if hierarchy.has_file:
+                documents_with_files += 1
                 matched_files.add(hierarchy.file_info.filename)
         
+        documents_without_files = total_documents - documents_with_files
+        
+        # Count orphaned files (files without matching documents)
         orphaned_files = len(self.document_files) - len(matched_files)
         
         return AlignmentMetrics(
@@ -351,21 +360,21 @@ class HierarchicalDocumentRegistry:
             return {'error': f'No file found for document {document_number}'}
         
         try:
-            with open(hierarchy.file_info.filepath, 'r', encoding='utf-8') as f:
-                content = json.load(f)
+            # Collect every subsection number in the file in one scan, so each
+            # expected subsection is a set lookup rather than a search. The raw
+            # file is scanned through a read-only memory map, without decoding
+            # or parsing it into a copy of its text.
+            with open(hierarchy.file_info.filepath, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                numbers_in_content = {
+                    number.decode('ascii') for number in SUBSECTION_IN_TEXT_RE.findall(content)
+                } if hierarchy.subsections else set()
             
-            # Extract text content for searching
-            if isinstance(content, dict):
-                text_content = str(content)
-            else:
-                text_content = str(content)
-            
-            # Check for subsection numbers in content
             found_subsections = []
             missing_subsections = []
             
             for subsection in hierarchy.subsections:
-                if subsection.number in text_content:
+                if subsection.number in numbers_in_content:
                     found_subsections.append(subsection.number)
                 else:
                     missing_subsections.append(subsection.number)
@@ -385,6 +394,77 @@ class HierarchicalDocumentRegistry:
         except Exception as e:
             return {'error': f'Failed to validate content: {str(e)}'}
 
+    
+    def _validation_cache_key(self, hierarchy: DocumentHierarchy) -> Optional[str]:
+        """Key a document's validation result by its file's path, mtime and size and its expected subsections"""
+        filepath = hierarchy.file_info.filepath
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return None
+        subsections = hashlib.blake2b(
+            "\n".join(sub.number for sub in hierarchy.subsections).encode('utf-8'), digest_size=8
+        ).hexdigest()
+        return f"{filepath}:{stat.st_mtime_ns}:{stat.st_size}:{subsections}"
+    
+    def validate_documents_with_files(self, max_workers: Optional[int] = None,
+                                      cache: Optional[Dict[str, Dict]] = None) -> List[Dict]:
+        """Validate the content of every document that has a file
+        
+        Documents are validated in parallel worker processes, each holding a
+        copy of this registry. Results are in hierarchy order.
+        
+        If a cache dict is given, documents whose file and expected subsections
+        are unchanged reuse their cached result. The cache is updated in place
+        to hold exactly this run's successful results.
+        """
+        document_numbers = [doc_num for doc_num, hierarchy in self.document_hierarchy.items()
+                            if hierarchy.has_file]
+        
+        results = {}
+        cache_keys = {}
+        pending = []
+        for doc_num in document_numbers:
+            key = self._validation_cache_key(self.document_hierarchy[doc_num]) if cache is not None else None
+            if key is not None and key in cache:
+                results[doc_num] = cache[key]
+            else:
+                pending.append(doc_num)
+            cache_keys[doc_num] = key
+        
+        workers = min(max_workers or get_validation_workers(), len(pending))
+        if workers <= 1:
+            validated = [self.validate_subsection_content(doc_num) for doc_num in pending]
+        else:
+            chunksize = max(1, len(pending) // (4 * workers))
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_validation_worker,
+                                     initargs=(self,)) as executor:
+                validated = list(executor.map(_validate_in_worker, pending, chunksize=chunksize))
+        results.update(zip(pending, validated))
+        
+        if cache is not None:
+            cache.clear()
+            for doc_num, key in cache_keys.items():
+                if key is not None and 'error' not in results[doc_num]:
+                    cache[key] = results[doc_num]
+        
+        return [results[doc_num] for doc_num in document_numbers]
+
+
+# Registry owned by the current validation worker process, set by _init_validation_worker
+_WORKER_REGISTRY: Optional[HierarchicalDocumentRegistry] = None
+
+
+def _init_validation_worker(registry: HierarchicalDocumentRegistry) -> None:
+    """Keep the registry sent to a validation worker for all of its documents"""
+    global _WORKER_REGISTRY
+    _WORKER_REGISTRY = registry
+
+
+def _validate_in_worker(document_number: str) -> Dict:
+    """Validate a single document's content in a worker process"""
+    return _WORKER_REGISTRY.validate_subsection_content(document_number)
+
 
 def create_registry_for_location(content_dir: str, toc_file: str = None) -> HierarchicalDocumentRegistry:
     """Factory function to create a registry for a specific location"""
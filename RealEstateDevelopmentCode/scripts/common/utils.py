@@ -8,28 +8,79 @@ Consolidates common utility functions to avoid duplication.
 """
 
 import json
+import mmap
+import os
 import re
+import tempfile
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from .config import PATTERNS
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Process umask, read once so temporary files can be given normal permissions
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 
 def load_json_file(file_path: str | Path) -> Dict[str, Any]:
-    """Load JSON file with error handling"""
+    """Load JSON file with error handling, using orjson when available"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
     except Exception as e:
         raise FileNotFoundError(f"Could not load JSON file {file_path}: {str(e)}")
 
 
 def save_json_file(data: Dict[str, Any], file_path: str | Path) -> None:
-    """Save data to JSON file with directory creation"""
+    """Save data to JSON file with directory creation, using orjson when available"""
     file_path = Path(file_path)
-    file_path.parent.mkdir(parents=True, exist_ok=True)
+    # One stat call in the usual case where the directory already exists;
+    # mkdir(exist_ok=True) alone costs a failed mkdir and then a stat
+    if not file_path.parent.is_dir():
+        file_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        file_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        # json.dump writes the encoder's chunks as they are produced, so the
+        # whole document is never held in memory as one string
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def write_bytes_atomic(file_path: str | Path, payload: bytes) -> None:
+    """Write bytes to a file so that readers never see a partial write
+    
+    The payload goes to a temporary file in the same directory, which is then
+    renamed over the target.
+    """
+    file_path = Path(file_path)
+    fd, tmp_path = tempfile.mkstemp(dir=file_path.parent, suffix=file_path.suffix + '.tmp')
+    try:
+        with os.fdopen(fd, 'wb', buffering=1 << 20) as f:
+            # mkstemp creates the file as 0600; give it the usual umask-based mode
+            os.chmod(tmp_path, 0o666 & ~_UMASK)
+            f.write(payload)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_json_mapped(file_path: str | Path) -> Any:
+    """Parse a JSON file through a read-only memory map instead of a buffered read"""
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            if orjson is not None:
+                return orjson.loads(view)
+            return json.loads(view.tobytes())
 
 
 def extract_number_from_filename(filename: str) -> Optional[str]: